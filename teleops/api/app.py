@@ -9,10 +9,12 @@ import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -116,6 +118,28 @@ app.add_middleware(
 )
 
 
+class _GZipExceptStreams:
+    """Gzip responses for clients that accept it, except NDJSON streams.
+
+    GZipMiddleware buffers streamed chunks inside the compressor, which
+    would hold back the RCA progress events until the stream ends, so
+    ``.../stream`` routes bypass it.
+    """
+
+    def __init__(self, app, minimum_size: int = 1000) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+app.add_middleware(_GZipExceptStreams)
+
+
 IP_RE = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 
@@ -246,6 +270,23 @@ def incident_to_dict(incident: Incident, redact: bool = False) -> dict[str, Any]
     return data
 
 
+def _etag_json_response(payload: Any, if_none_match: str | None) -> Response:
+    """Serialize payload with a content-hash ETag; answer 304 if the client already has it.
+
+    The tag is weak because the same hash is sent whether or not the body is
+    gzipped, and a strong validator must differ between content-codings.
+    """
+    response = JSONResponse(payload)
+    opaque_tag = f'"{hashlib.sha256(response.body).hexdigest()[:32]}"'
+    etag = f"W/{opaque_tag}"
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if opaque_tag in candidates or "*" in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
 def _load_fixture(name: str) -> dict[str, Any]:
     fixture_dir = Path(settings.integrations_fixtures_dir)
     path = fixture_dir / name
@@ -414,12 +455,13 @@ def list_incidents(
     db: Session = Depends(get_db),
     _: None = Depends(require_api_token),
     tenant_id: str | None = Depends(require_tenant_id),
+    if_none_match: str | None = Header(default=None),
 ):
     query = db.query(Incident)
     if tenant_id:
         query = query.filter(Incident.tenant_id == tenant_id)
     incidents = query.all()
-    return [incident_to_dict(incident) for incident in incidents]
+    return _etag_json_response([incident_to_dict(incident) for incident in incidents], if_none_match)
 
 
 @app.get("/incidents/{incident_id}/alerts")
@@ -429,6 +471,7 @@ def list_incident_alerts(
     _: None = Depends(require_api_token),
     tenant_id: str | None = Depends(require_tenant_id),
     include_raw: bool = Query(False),
+    limit: int | None = Query(None, ge=1, le=1000, description="Return at most this many alerts, oldest first"),
 ):
     incident = db.query(Incident).filter(Incident.id == incident_id).first()
     if not incident:
@@ -437,7 +480,10 @@ def list_incident_alerts(
         raise HTTPException(status_code=404, detail="Incident not found")
     if not incident.related_alert_ids:
         return []
-    alerts = db.query(Alert).filter(Alert.id.in_(incident.related_alert_ids)).all()
+    query = db.query(Alert).filter(Alert.id.in_(incident.related_alert_ids))
+    if limit is not None:
+        query = query.order_by(Alert.timestamp).limit(limit)
+    alerts = query.all()
     return [alert_to_dict(alert, include_raw=include_raw) for alert in alerts]
 
 
@@ -501,25 +547,12 @@ def generate_baseline_rca(
     return result
 
 
-@app.post("/rca/{incident_id}/llm")
-def generate_llm_rca(
-    incident_id: str,
-    db: Session = Depends(get_db),
-    _: None = Depends(require_api_token),
-    tenant_id: str | None = Depends(require_tenant_id),
-):
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
-    if not incident:
-        raise HTTPException(status_code=404, detail="Incident not found")
-    if tenant_id and incident.tenant_id != tenant_id:
-        raise HTTPException(status_code=404, detail="Incident not found")
+class _LLMRCAError(Exception):
+    """RAG retrieval or LLM generation failed during an LLM RCA run."""
 
-    logger.info(f"Generating LLM RCA for incident {incident_id}")
-
-    alerts = db.query(Alert).filter(Alert.id.in_(incident.related_alert_ids)).all()
-    incident_dict = incident_to_dict(incident, redact=True)
-    alerts_dicts = [alert_to_dict(alert, redact=True) for alert in alerts]
 
+def _llm_rca_inputs(incident: Incident, alerts: list[Alert]) -> dict[str, Any]:
+    """Collect the redacted prompt inputs and RAG query for an LLM RCA run."""
     alert_types = sorted({alert.alert_type for alert in alerts if alert.alert_type})
     hosts = sorted({alert.host for alert in alerts if alert.host})
     severities = sorted({alert.severity for alert in alerts if alert.severity})
@@ -530,20 +563,42 @@ def generate_llm_rca(
         f"severity: {', '.join(severities)} | "
         f"count: {len(alerts)}"
     )
-    redacted_rag_query = _redact_obj(rag_query, tenant_id=incident.tenant_id)
+    return {
+        "incident_id": incident.id,
+        "tenant_id": incident.tenant_id,
+        "incident": incident_to_dict(incident, redact=True),
+        "alerts": [alert_to_dict(alert, redact=True) for alert in alerts],
+        "rag_query": rag_query,
+    }
+
+
+def _llm_rca_events(db: Session, inputs: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Run an LLM RCA, yielding a stage event before each slow step.
+
+    The last event is ``{"event": "result", "data": ...}`` once the artifact
+    is stored. RAG/LLM failures raise ``_LLMRCAError``.
+    """
+    incident_id = inputs["incident_id"]
+    tenant_id = inputs["tenant_id"]
+    incident_dict = inputs["incident"]
+    alerts_dicts = inputs["alerts"]
+    rag_query = inputs["rag_query"]
+    redacted_rag_query = _redact_obj(rag_query, tenant_id=tenant_id)
     try:
         t0 = time.perf_counter()
+        yield {"event": "stage", "stage": "retrieving_context"}
         rag_context = get_rag_context(rag_query)
-        redacted_rag_context = _redact_obj(rag_context, tenant_id=incident.tenant_id)
+        redacted_rag_context = _redact_obj(rag_context, tenant_id=tenant_id)
+        yield {"event": "stage", "stage": "generating"}
         result = llm_rca(incident_dict, alerts_dicts, redacted_rag_context)
         duration_ms = round((time.perf_counter() - t0) * 1000, 2)
     except Exception as exc:
         logger.error(f"LLM/RAG error for incident {incident_id}: {exc}")
-        raise HTTPException(status_code=502, detail=f"LLM/RAG error: {exc}") from exc
+        raise _LLMRCAError(f"LLM/RAG error: {exc}") from exc
 
     # Store evidence for evaluation, traceability, and LLM Trace UI
     artifact = RCAArtifact(
-        incident_id=incident.id,
+        incident_id=incident_id,
         hypotheses=result.get("hypotheses", []),
         evidence=_redact_obj(
             {
@@ -558,7 +613,7 @@ def generate_llm_rca(
                 "alerts_count": len(alerts_dicts),
                 "rag_chunks_used": len(redacted_rag_context) if isinstance(redacted_rag_context, list) else 1,
             },
-            tenant_id=incident.tenant_id,
+            tenant_id=tenant_id,
         ),
         confidence_scores=result.get("confidence_scores", {}),
         llm_model=result.get("model", "unknown"),
@@ -568,14 +623,72 @@ def generate_llm_rca(
     db.commit()
 
     # Sync updated incident (now includes LLM RCA artifact) to Firestore
-    sync_incident_to_firestore(incident.id)
+    sync_incident_to_firestore(incident_id)
 
     result["duration_ms"] = duration_ms
     result["artifact_id"] = artifact.id
     logger.info(f"LLM RCA complete for incident {incident_id} in {duration_ms}ms")
+    yield {"event": "result", "data": result}
+
+
+def _load_llm_rca_inputs(db: Session, incident_id: str, tenant_id: str | None) -> dict[str, Any]:
+    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    if not incident:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    if tenant_id and incident.tenant_id != tenant_id:
+        raise HTTPException(status_code=404, detail="Incident not found")
+
+    logger.info(f"Generating LLM RCA for incident {incident_id}")
+
+    alerts = db.query(Alert).filter(Alert.id.in_(incident.related_alert_ids)).all()
+    return _llm_rca_inputs(incident, alerts)
+
+
+@app.post("/rca/{incident_id}/llm")
+def generate_llm_rca(
+    incident_id: str,
+    db: Session = Depends(get_db),
+    _: None = Depends(require_api_token),
+    tenant_id: str | None = Depends(require_tenant_id),
+):
+    inputs = _load_llm_rca_inputs(db, incident_id, tenant_id)
+    result: dict[str, Any] = {}
+    try:
+        for event in _llm_rca_events(db, inputs):
+            if event["event"] == "result":
+                result = event["data"]
+    except _LLMRCAError as exc:
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
     return result
 
 
+@app.post("/rca/{incident_id}/llm/stream")
+def stream_llm_rca(
+    incident_id: str,
+    db: Session = Depends(get_db),
+    _: None = Depends(require_api_token),
+    tenant_id: str | None = Depends(require_tenant_id),
+):
+    """LLM RCA as newline-delimited JSON progress events.
+
+    Emits ``{"event": "stage", "stage": ...}`` lines while context is
+    retrieved and the model runs, then one ``result`` line with the same
+    payload as ``POST /rca/{incident_id}/llm``, or one ``error`` line.
+    """
+    inputs = _load_llm_rca_inputs(db, incident_id, tenant_id)
+
+    def ndjson() -> Iterator[str]:
+        try:
+            for event in _llm_rca_events(db, inputs):
+                yield json.dumps(event, default=str) + "\n"
+        except _LLMRCAError as exc:
+            yield json.dumps({"event": "error", "detail": str(exc)}) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @app.get("/rca/{incident_id}/latest")
 def get_latest_rca(
     incident_id: str,
@@ -655,9 +768,11 @@ def ingest_jira_webhook(
 
 @app.get("/metrics/overview")
 def get_metrics_overview(
+    include_per_scenario: bool = Query(True, description="Include evaluation_results.per_scenario"),
     db: Session = Depends(get_db),
     _: None = Depends(require_metrics_token),
     tenant_id: str | None = Depends(require_tenant_id),
+    if_none_match: str | None = Header(default=None),
 ):
     alert_query = db.query(Alert)
     incident_query = db.query(Incident)
@@ -706,7 +821,11 @@ def get_metrics_overview(
     if compare_ms and compare_ms > 0:
         improvement_factor = round((manual_triage_estimate_min * 60 * 1000) / compare_ms)
 
-    return {
+    evaluation_results = _load_metrics_file(settings.evaluation_results_path)
+    if evaluation_results and not include_per_scenario:
+        evaluation_results.pop("per_scenario", None)
+
+    overview = {
         "counts": {
             "alerts": alert_count,
             "incidents": incident_count,
@@ -716,7 +835,7 @@ def get_metrics_overview(
             "avg_alerts_per_incident": round(avg_alerts, 2),
         },
         "test_results": _load_metrics_file(settings.test_results_path),
-        "evaluation_results": _load_metrics_file(settings.evaluation_results_path),
+        "evaluation_results": evaluation_results,
         "human_review": {
             "total_artifacts": len(all_artifacts),
             "pending_review": pending,
@@ -731,6 +850,17 @@ def get_metrics_overview(
             "improvement_factor": improvement_factor,
         },
     }
+    return _etag_json_response(overview, if_none_match)
+
+
+@app.get("/metrics/evaluation/per-scenario")
+def get_evaluation_per_scenario(
+    _: None = Depends(require_metrics_token),
+    if_none_match: str | None = Header(default=None),
+):
+    """Per-scenario evaluation breakdown, split out of /metrics/overview for lazy loading."""
+    evaluation_results = _load_metrics_file(settings.evaluation_results_path) or {}
+    return _etag_json_response({"per_scenario": evaluation_results.get("per_scenario", [])}, if_none_match)
 
 
 @app.post("/rca/{artifact_id}/review")
@@ -22,6 +22,8 @@ class Settings(BaseSettings):
     llm_provider: str = "gemini"
     llm_model: str = "gemini-3-flash-preview"
     llm_timeout_seconds: float = 60.0
+    # Responses from the OpenAI-compatible endpoint are aborted past this size
+    llm_max_response_bytes: int = 2_000_000
 
     # OpenAI-compatible endpoint for local/hosted Tele-LLM
     llm_base_url: str = "http://localhost:8001/v1"
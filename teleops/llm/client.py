@@ -99,6 +99,12 @@ class OpenAICompatibleClient(BaseLLMClient):
         self.model = model
 
     def generate(self, prompt: str) -> dict[str, Any]:
+        """POST the prompt and parse the model's JSON answer.
+
+        The body is read as it arrives and the request is aborted once it
+        passes ``settings.llm_max_response_bytes``, so a runaway response
+        fails fast instead of being read to the end.
+        """
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
@@ -113,16 +119,22 @@ class OpenAICompatibleClient(BaseLLMClient):
         }
         url = f"{self.base_url}/chat/completions"
         timeout = settings.llm_timeout_seconds
+        max_bytes = settings.llm_max_response_bytes
         logger.info(f"LLM request to {url} with model={self.model}, timeout={timeout}s")
 
+        body = bytearray()
         with httpx.Client(timeout=timeout) as client:
-            response = client.post(url, headers=headers, json=payload)
-
-        if response.status_code >= 400:
-            logger.error(f"LLM request failed: {response.status_code} {response.text[:200]}")
-            raise LLMClientError(f"LLM request failed: {response.status_code} {response.text}")
-
-        data = response.json()
+            with client.stream("POST", url, headers=headers, json=payload) as response:
+                if response.status_code >= 400:
+                    text = response.read().decode("utf-8", errors="replace")
+                    logger.error(f"LLM request failed: {response.status_code} {text[:200]}")
+                    raise LLMClientError(f"LLM request failed: {response.status_code} {text}")
+                for chunk in response.iter_bytes():
+                    body += chunk
+                    if len(body) > max_bytes:
+                        raise LLMClientError(f"LLM response exceeded {max_bytes} bytes")
+
+        data = json.loads(body)
         content = data["choices"][0]["message"]["content"]
         logger.info(f"LLM response received, parsing JSON ({len(content)} chars)")
         return _parse_json_response(content)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from typing import Any
 
@@ -80,6 +81,35 @@ BASELINE_RULES: list[dict[str, Any]] = [
 ]
 
 
+# Every distinct keyword is searched once per call; rules then count their hits
+# against the resulting set instead of re-scanning the text per rule.
+_RULE_KEYWORDS: tuple[str, ...] = tuple(sorted({p for rule in BASELINE_RULES for p in rule["patterns"]}))
+_RULE_PATTERN_SETS: tuple[tuple[dict[str, Any], frozenset[str]], ...] = tuple(
+    (rule, frozenset(rule["patterns"])) for rule in BASELINE_RULES
+)
+
+
+def _build_search_text(summary: str, alerts: list[dict[str, Any]] | None) -> str:
+    parts = [summary]
+    for alert in (alerts or [])[:20]:  # Check first 20 alerts
+        parts.append(f"{alert.get('alert_type', '')} {alert.get('message', '')}")
+    return " ".join(parts).lower()
+
+
+def _match_rule(search_text: str) -> tuple[dict[str, Any] | None, int]:
+    """Return the rule with the most keyword hits (first rule wins ties)."""
+    found = {keyword for keyword in _RULE_KEYWORDS if keyword in search_text}
+
+    best_rule = None
+    best_count = 0
+    for rule, patterns in _RULE_PATTERN_SETS:
+        count = len(patterns & found)
+        if count > best_count:
+            best_count = count
+            best_rule = rule
+    return best_rule, best_count
+
+
 def baseline_rca(incident_summary: str, alerts: list[dict[str, Any]] | None = None) -> dict[str, Any]:
     """Generate baseline RCA using pattern-matching rules.
 
@@ -94,21 +124,7 @@ def baseline_rca(incident_summary: str, alerts: list[dict[str, Any]] | None = No
     Returns:
         RCA result with hypotheses, confidence scores, and evidence
     """
-    # Build search text from incident summary and alerts
-    search_text = incident_summary.lower()
-    if alerts:
-        for alert in alerts[:20]:  # Check first 20 alerts
-            search_text += f" {alert.get('alert_type', '')} {alert.get('message', '')}".lower()
-
-    # Find matching rule
-    matched_rule = None
-    match_count = 0
-
-    for rule in BASELINE_RULES:
-        current_matches = sum(1 for pattern in rule["patterns"] if pattern in search_text)
-        if current_matches > match_count:
-            match_count = current_matches
-            matched_rule = rule
+    matched_rule, match_count = _match_rule(_build_search_text(incident_summary, alerts))
 
     # Use matched rule or default to last rule (network_degradation)
     if matched_rule is None:
@@ -134,17 +150,7 @@ def _detect_scenario_hint(incident: dict[str, Any], alerts: list[dict[str, Any]]
     Uses the same pattern-matching rules as the baseline RCA to identify the
     most likely scenario type. Returns a short hint string for the LLM prompt.
     """
-    search_text = (incident.get("summary", "") or "").lower()
-    for alert in alerts[:20]:
-        search_text += f" {alert.get('alert_type', '')} {alert.get('message', '')}".lower()
-
-    best_rule = None
-    best_matches = 0
-    for rule in BASELINE_RULES:
-        matches = sum(1 for p in rule["patterns"] if p in search_text)
-        if matches > best_matches:
-            best_matches = matches
-            best_rule = rule
+    best_rule, best_matches = _match_rule(_build_search_text(incident.get("summary", "") or "", alerts))
 
     if best_rule and best_matches >= 2:
         return best_rule["hypothesis"]
@@ -152,76 +158,66 @@ def _detect_scenario_hint(incident: dict[str, Any], alerts: list[dict[str, Any]]
     return ""
 
 
-def build_prompt(incident: dict[str, Any], alerts: list[dict[str, Any]], rag_context: list[str]) -> str:
-    # Extract alert types and detect scenario hint from baseline pattern matching
-    alert_types = sorted({a.get("alert_type", "") for a in alerts[:20] if a.get("alert_type")})
-    hosts = sorted({a.get("host", "") for a in alerts[:20] if a.get("host")})
-    scenario_hint = _detect_scenario_hint(incident, alerts)
+_PROMPT_INSTRUCTION = (
+    "Analyze the incident below and produce a root cause analysis. "
+    "Return only valid JSON following the schema below. "
+    "Do not wrap the JSON in markdown or code fences. "
+    "Output must start with '{' and end with '}' with no surrounding text."
+)
 
-    prompt = {
-        "instruction": (
-            "Analyze the incident below and produce a root cause analysis. "
-            "Return only valid JSON following the schema below. "
-            "Do not wrap the JSON in markdown or code fences. "
-            "Output must start with '{' and end with '}' with no surrounding text."
-        ),
-        "schema": {
-            "incident_summary": "string - restate the incident in your own words",
-            "hypotheses": ["string - specific root cause naming components and failure mode"],
-            "confidence_scores": {"hypothesis_text": "float 0.0-1.0"},
-            "evidence": {
-                "alert_signals": "string - which alert types support this hypothesis",
-                "affected_components": "string - specific hosts/links/services affected",
-                "rag_references": "string - relevant context from runbooks",
-            },
-            "generated_at": "ISO-8601 timestamp",
-            "model": "string - your model identifier",
+_PROMPT_SCHEMA: dict[str, Any] = {
+    "incident_summary": "string - restate the incident in your own words",
+    "hypotheses": ["string - specific root cause naming components and failure mode"],
+    "confidence_scores": {"hypothesis_text": "float 0.0-1.0"},
+    "evidence": {
+        "alert_signals": "string - which alert types support this hypothesis",
+        "affected_components": "string - specific hosts/links/services affected",
+        "rag_references": "string - relevant context from runbooks",
+    },
+    "generated_at": "ISO-8601 timestamp",
+    "model": "string - your model identifier",
+}
+
+_PROMPT_FEW_SHOT_EXAMPLES: list[dict[str, Any]] = [
+    {
+        "incident_summary": "DNS resolution failures across region-east",
+        "hypotheses": ["authoritative DNS cluster outage in region-east"],
+        "confidence_scores": {"authoritative DNS cluster outage in region-east": 0.75},
+        "evidence": {
+            "alert_signals": "dns_timeout (12 alerts), servfail_spike (8 alerts), nx_domain_spike (5 alerts)",
+            "affected_components": "dns-auth-1, dns-rec-1",
+            "rag_references": "DNS outage runbook: check SOA records, verify zone transfer status",
         },
-        "few_shot_examples": [
-            {
-                "incident_summary": "DNS resolution failures across region-east",
-                "hypotheses": ["authoritative DNS cluster outage in region-east"],
-                "confidence_scores": {"authoritative DNS cluster outage in region-east": 0.75},
-                "evidence": {
-                    "alert_signals": "dns_timeout (12 alerts), servfail_spike (8 alerts), nx_domain_spike (5 alerts)",
-                    "affected_components": "dns-auth-1, dns-rec-1",
-                    "rag_references": "DNS outage runbook: check SOA records, verify zone transfer status",
-                },
-            },
-            {
-                "incident_summary": "High packet loss on core backbone links",
-                "hypotheses": [
-                    "fiber cut on metro ring segment causing optical link failure",
-                    "link congestion on core-router-1 due to traffic rerouting",
-                ],
-                "confidence_scores": {
-                    "fiber cut on metro ring segment causing optical link failure": 0.65,
-                    "link congestion on core-router-1 due to traffic rerouting": 0.30,
-                },
-                "evidence": {
-                    "alert_signals": "link_down (6 alerts), loss_of_signal (4 alerts), packet_loss (15 alerts)",
-                    "affected_components": "core-router-1, core-router-2, agg-switch-2",
-                    "rag_references": "Fiber cut runbook: check optical power levels, verify DWDM transponder status",
-                },
-            },
-        ],
-        "scenario_hint": scenario_hint if scenario_hint else "No strong pattern match -- analyze alerts independently",
-        "incident": incident,
-        "alerts_sample": alerts[:20],
-        "alert_type_summary": alert_types,
-        "affected_hosts": hosts,
-        "rag_context": rag_context,
-        "constraints": [
-            "Do not invent remediation commands.",
-            "If uncertain, include lower confidence score.",
-            "Hypotheses must name specific infrastructure components (routers, links, services).",
-            "Evidence must reference specific alert types from the alerts_sample.",
-            "Limit to 1-3 hypotheses, ordered by confidence (highest first).",
-            "Confidence scores must reflect genuine uncertainty -- do not default to 0.5.",
-            "Use the rag_context to ground your analysis in domain-specific knowledge.",
+    },
+    {
+        "incident_summary": "High packet loss on core backbone links",
+        "hypotheses": [
+            "fiber cut on metro ring segment causing optical link failure",
+            "link congestion on core-router-1 due to traffic rerouting",
         ],
-    }
-    return json_dumps(prompt)
+        "confidence_scores": {
+            "fiber cut on metro ring segment causing optical link failure": 0.65,
+            "link congestion on core-router-1 due to traffic rerouting": 0.30,
+        },
+        "evidence": {
+            "alert_signals": "link_down (6 alerts), loss_of_signal (4 alerts), packet_loss (15 alerts)",
+            "affected_components": "core-router-1, core-router-2, agg-switch-2",
+            "rag_references": "Fiber cut runbook: check optical power levels, verify DWDM transponder status",
+        },
+    },
+]
+
+_PROMPT_CONSTRAINTS: list[str] = [
+    "Do not invent remediation commands.",
+    "If uncertain, include lower confidence score.",
+    "Hypotheses must name specific infrastructure components (routers, links, services).",
+    "Evidence must reference specific alert types from the alerts_sample.",
+    "Limit to 1-3 hypotheses, ordered by confidence (highest first).",
+    "Confidence scores must reflect genuine uncertainty -- do not default to 0.5.",
+    "Use the rag_context to ground your analysis in domain-specific knowledge.",
+]
+
+_NO_SCENARIO_HINT = "No strong pattern match -- analyze alerts independently"
 
 
 def _json_default(value: Any) -> str:
@@ -230,9 +226,43 @@ def _json_default(value: Any) -> str:
     return str(value)
 
 
-def json_dumps(payload: dict[str, Any]) -> str:
-    import json
+def _prompt_field(key: str, value: Any) -> str:
+    """Serialize one top-level prompt field exactly as ``json_dumps`` nests it."""
+    return f"  {json.dumps(key)}: " + json.dumps(value, indent=2, default=_json_default).replace("\n", "\n  ")
+
 
+# The static prompt sections never change, so they are serialized once here
+# and only the per-incident fields are encoded in build_prompt.
+_PROMPT_HEAD = ",\n".join(
+    [
+        _prompt_field("instruction", _PROMPT_INSTRUCTION),
+        _prompt_field("schema", _PROMPT_SCHEMA),
+        _prompt_field("few_shot_examples", _PROMPT_FEW_SHOT_EXAMPLES),
+    ]
+)
+_PROMPT_TAIL = _prompt_field("constraints", _PROMPT_CONSTRAINTS)
+
+
+def build_prompt(incident: dict[str, Any], alerts: list[dict[str, Any]], rag_context: list[str]) -> str:
+    # Extract alert types and detect scenario hint from baseline pattern matching
+    alert_types = sorted({a.get("alert_type", "") for a in alerts[:20] if a.get("alert_type")})
+    hosts = sorted({a.get("host", "") for a in alerts[:20] if a.get("host")})
+    scenario_hint = _detect_scenario_hint(incident, alerts)
+
+    fields = [
+        _PROMPT_HEAD,
+        _prompt_field("scenario_hint", scenario_hint if scenario_hint else _NO_SCENARIO_HINT),
+        _prompt_field("incident", incident),
+        _prompt_field("alerts_sample", alerts[:20]),
+        _prompt_field("alert_type_summary", alert_types),
+        _prompt_field("affected_hosts", hosts),
+        _prompt_field("rag_context", rag_context),
+        _PROMPT_TAIL,
+    ]
+    return "{\n" + ",\n".join(fields) + "\n}"
+
+
+def json_dumps(payload: dict[str, Any]) -> str:
     return json.dumps(payload, indent=2, default=_json_default)
 
 
@@ -7,6 +7,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from teleops.api.app import app, get_db
+from teleops.config import settings
 from teleops.models import Base
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -31,9 +32,20 @@ def db_session():
         session.close()
 
 
+@pytest.fixture()
+def settings_override(monkeypatch):
+    """Apply several ``settings`` overrides in one call; undone at teardown."""
+
+    def _apply(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(settings, name, value)
+
+    return _apply
+
+
 @pytest.fixture()
 def client(db_session):
-    token = getattr(__import__("teleops.config", fromlist=["settings"]).settings, "api_token", None)
+    token = getattr(settings, "api_token", None)
 
     def override_get_db():
         try:
@@ -13,3 +13,40 @@ def test_alerts_and_reset(client):
     alerts_after = client.get("/alerts")
     assert alerts_after.status_code == 200
     assert alerts_after.json() == []
+
+
+def test_incidents_conditional_get(client):
+    scenario = {"alert_rate_per_min": 5, "duration_min": 3, "noise_rate_per_min": 1}
+    client.post("/generate", json={"incident_type": "dns_outage", **scenario})
+
+    first = client.get("/incidents")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    # One weak validator covers both the gzip and identity encodings
+    assert client.get("/incidents", headers={"Accept-Encoding": "gzip"}).headers["ETag"] == etag
+
+    cached = client.get("/incidents", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    client.post("/generate", json={"incident_type": "network_degradation", **scenario})
+    changed = client.get("/incidents", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) > len(first.json())
+
+
+def test_large_responses_are_gzipped(client):
+    scenario = {"alert_rate_per_min": 5, "duration_min": 3, "noise_rate_per_min": 1}
+    client.post("/generate", json={"incident_type": "dns_outage", **scenario})
+
+    resp = client.get("/alerts", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json()
+
+    plain = client.get("/alerts", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == resp.json()
@@ -1,3 +1,6 @@
+import json
+
+
 def test_rca_endpoints(client, monkeypatch):
     resp = client.post("/generate", json={"alert_rate_per_min": 5, "duration_min": 3, "noise_rate_per_min": 1})
     assert resp.status_code == 200
@@ -30,3 +33,43 @@ def test_rca_endpoints(client, monkeypatch):
     latest = client.get(f"/rca/{incident_id}/latest?source=any")
     assert latest.status_code == 200
     assert latest.json()["incident_id"] == incident_id
+
+
+def test_llm_rca_stream_emits_stages_then_result(client, monkeypatch):
+    resp = client.post("/generate", json={"alert_rate_per_min": 5, "duration_min": 3, "noise_rate_per_min": 1})
+    incident_id = resp.json()["incidents_created"][0]["id"]
+
+    monkeypatch.setattr("teleops.api.app.get_rag_context", lambda query: ["context"])
+    monkeypatch.setattr(
+        "teleops.api.app.llm_rca",
+        lambda incident, alerts, rag_context: {"hypotheses": ["fake"], "confidence_scores": {}, "model": "fake-llm"},
+    )
+
+    stream = client.post(f"/rca/{incident_id}/llm/stream", headers={"Accept-Encoding": "gzip"})
+    assert stream.status_code == 200
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    assert "content-encoding" not in stream.headers
+    events = [json.loads(line) for line in stream.text.splitlines()]
+    assert [e.get("stage") for e in events[:-1]] == ["retrieving_context", "generating"]
+    assert events[-1]["event"] == "result"
+    assert events[-1]["data"]["model"] == "fake-llm"
+    assert events[-1]["data"]["artifact_id"]
+
+    latest = client.get(f"/rca/{incident_id}/latest")
+    assert latest.json()["llm_model"] == "fake-llm"
+
+
+def test_llm_rca_stream_reports_errors(client, monkeypatch):
+    resp = client.post("/generate", json={"alert_rate_per_min": 5, "duration_min": 3, "noise_rate_per_min": 1})
+    incident_id = resp.json()["incidents_created"][0]["id"]
+
+    def broken_rag(query):
+        raise RuntimeError("index offline")
+
+    monkeypatch.setattr("teleops.api.app.get_rag_context", broken_rag)
+
+    events = [json.loads(line) for line in client.post(f"/rca/{incident_id}/llm/stream").text.splitlines()]
+    assert events[-1] == {"event": "error", "detail": "LLM/RAG error: index offline"}
+
+    assert client.post(f"/rca/{incident_id}/llm").status_code == 502
+    assert client.post("/rca/missing/llm/stream").status_code == 404
@@ -10,3 +10,18 @@ def test_incident_alerts_endpoint(client):
     assert alerts_resp.status_code == 200
     alerts = alerts_resp.json()
     assert len(alerts) >= 1
+
+
+def test_incident_alerts_endpoint_limit(client):
+    resp = client.post("/generate", json={"alert_rate_per_min": 10, "duration_min": 3, "noise_rate_per_min": 0})
+    assert resp.status_code == 200
+    incident = resp.json()["incidents_created"][0]
+    assert len(incident["related_alert_ids"]) > 2
+
+    alerts_resp = client.get(f"/incidents/{incident['id']}/alerts", params={"limit": 2})
+    assert alerts_resp.status_code == 200
+    alerts = alerts_resp.json()
+    assert len(alerts) == 2
+    assert alerts[0]["timestamp"] <= alerts[1]["timestamp"]
+
+    assert client.get(f"/incidents/{incident['id']}/alerts", params={"limit": 0}).status_code == 422
@@ -2,7 +2,6 @@ import json
 
 import pytest
 
-from teleops.config import settings
 from teleops.llm.client import LLMClientError, OpenAICompatibleClient, get_llm_client
 
 
@@ -38,8 +37,9 @@ class DummyHttpxClient:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def post(self, url, headers, json):
-        return self._response
+    def stream(self, method, url, **kwargs):
+        body = {"choices": [{"message": {"content": self._response._content}}]}
+        return DummyStreamResponse(self._response.status_code, json.dumps(body).encode())
 
 
 class DummyHttpxErrorClient(DummyHttpxClient):
@@ -47,6 +47,25 @@ class DummyHttpxErrorClient(DummyHttpxClient):
         self._response = DummyResponse(500, "error")
 
 
+class DummyStreamResponse:
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def read(self):
+        return self._body
+
+    def iter_bytes(self, chunk_size=8):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+
 def test_openai_client_generate_parses(monkeypatch):
     monkeypatch.setattr("teleops.llm.client.httpx.Client", DummyHttpxClient)
     client = OpenAICompatibleClient("http://example.com", None, "test")
@@ -61,14 +80,22 @@ def test_openai_client_generate_error(monkeypatch):
         client.generate("prompt")
 
 
-def test_get_llm_client_unsupported(monkeypatch):
-    monkeypatch.setattr(settings, "llm_provider", "unknown")
-    with pytest.raises(LLMClientError):
-        get_llm_client()
+def test_openai_client_generate_enforces_size_cap(monkeypatch, settings_override):
+    monkeypatch.setattr("teleops.llm.client.httpx.Client", DummyHttpxClient)
+    settings_override(llm_max_response_bytes=16)
+    client = OpenAICompatibleClient("http://example.com", None, "test")
+    with pytest.raises(LLMClientError, match="exceeded"):
+        client.generate("prompt")
 
 
-def test_get_llm_client_gemini_requires_key(monkeypatch):
-    monkeypatch.setattr(settings, "llm_provider", "gemini")
-    monkeypatch.setattr(settings, "gemini_api_key", None)
-    with pytest.raises(LLMClientError):
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"llm_provider": "unknown"}, "Unsupported LLM provider"),
+        ({"llm_provider": "gemini", "gemini_api_key": None}, "GEMINI_API_KEY is required"),
+    ],
+)
+def test_get_llm_client_errors(settings_override, overrides, message):
+    settings_override(**overrides)
+    with pytest.raises(LLMClientError, match=message):
         get_llm_client()
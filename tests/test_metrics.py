@@ -60,3 +60,50 @@ def test_metrics_overview_includes_counts_and_files(client, db_session, tmp_path
     assert payload["counts"]["rca_artifacts"] == 1
     assert payload["test_results"]["status"] == "passed"
     assert payload["evaluation_results"]["baseline_avg"] == 0.5
+
+
+def test_metrics_overview_can_omit_per_scenario(client, tmp_path, monkeypatch):
+    eval_results_path = tmp_path / "evaluation_results.json"
+    per_scenario = [{"scenario": "network_degradation", "baseline": 0.4}]
+    eval_results_path.write_text(
+        json.dumps({"baseline_avg": 0.5, "per_scenario": per_scenario}), encoding="utf-8"
+    )
+    monkeypatch.setattr(settings, "evaluation_results_path", str(eval_results_path))
+
+    full = client.get("/metrics/overview").json()
+    assert full["evaluation_results"]["per_scenario"] == per_scenario
+
+    slim = client.get("/metrics/overview", params={"include_per_scenario": "false"}).json()
+    assert "per_scenario" not in slim["evaluation_results"]
+    assert slim["evaluation_results"]["baseline_avg"] == 0.5
+
+    resp = client.get("/metrics/evaluation/per-scenario")
+    assert resp.status_code == 200
+    assert resp.json() == {"per_scenario": per_scenario}
+
+
+def test_metrics_overview_conditional_get(client, db_session):
+    first = client.get("/metrics/overview")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get("/metrics/overview", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    db_session.add(
+        Alert(
+            source_system="net-snmp",
+            host="core-router-1",
+            service="backbone",
+            severity="critical",
+            alert_type="packet_loss",
+            message="loss",
+            tags={},
+            raw_payload={},
+        )
+    )
+    db_session.commit()
+    changed = client.get("/metrics/overview", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["counts"]["alerts"] == 1
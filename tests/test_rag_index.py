@@ -1,4 +1,5 @@
-from teleops.config import settings
+import pytest
+
 from teleops.rag import index
 
 
@@ -56,9 +57,10 @@ class DummyEmbed:
     model_name = "dummy-model"
 
 
-def _fake_require_llama_index():
-    # Returns: (SimpleDirectoryReader, StorageContext, VectorStoreIndex,
-    #          load_index_from_storage, BaseEmbedding, SimpleVectorStore)
+@pytest.fixture(scope="module")
+def fake_llama():
+    # (SimpleDirectoryReader, StorageContext, VectorStoreIndex,
+    #  load_index_from_storage, BaseEmbedding, SimpleVectorStore)
     return (
         DummyReader,
         DummyStorageContext,
@@ -73,18 +75,21 @@ def _fake_make_gemini_embedding(_base_embedding_cls):
     return DummyEmbed()
 
 
-def test_build_or_load_index_creates_and_retrieves(tmp_path, monkeypatch):
+@pytest.fixture()
+def patched_index(monkeypatch, fake_llama):
+    monkeypatch.setattr(index, "_require_llama_index", lambda: fake_llama)
+    monkeypatch.setattr(index, "_make_gemini_embedding", _fake_make_gemini_embedding)
+    # Reset the module-level cache so each test gets a fresh build path
+    monkeypatch.setattr(index, "_INDEX", None)
+
+
+def test_build_or_load_index_creates_and_retrieves(tmp_path, patched_index, settings_override):
     corpus_dir = tmp_path / "corpus"
     index_dir = tmp_path / "index"
     corpus_dir.mkdir()
     (corpus_dir / "doc.txt").write_text("test", encoding="utf-8")
 
-    monkeypatch.setattr(settings, "rag_corpus_dir", str(corpus_dir))
-    monkeypatch.setattr(settings, "rag_index_dir", str(index_dir))
-    monkeypatch.setattr(index, "_require_llama_index", _fake_require_llama_index)
-    monkeypatch.setattr(index, "_make_gemini_embedding", _fake_make_gemini_embedding)
-    # Reset the module-level cache so each test gets a fresh build path
-    monkeypatch.setattr(index, "_INDEX", None)
+    settings_override(rag_corpus_dir=str(corpus_dir), rag_index_dir=str(index_dir))
 
     built = index.build_or_load_index()
     assert isinstance(built, DummyIndex)
@@ -93,19 +98,14 @@ def test_build_or_load_index_creates_and_retrieves(tmp_path, monkeypatch):
     assert context == ["test context"]
 
 
-def test_build_or_load_index_uses_existing(tmp_path, monkeypatch):
+def test_build_or_load_index_uses_existing(tmp_path, patched_index, settings_override):
     corpus_dir = tmp_path / "corpus"
     index_dir = tmp_path / "index"
     corpus_dir.mkdir()
     index_dir.mkdir()
     (index_dir / "docstore.json").write_text("{}", encoding="utf-8")
 
-    monkeypatch.setattr(settings, "rag_corpus_dir", str(corpus_dir))
-    monkeypatch.setattr(settings, "rag_index_dir", str(index_dir))
-    monkeypatch.setattr(index, "_require_llama_index", _fake_require_llama_index)
-    monkeypatch.setattr(index, "_make_gemini_embedding", _fake_make_gemini_embedding)
-    # Reset the module-level cache so each test gets a fresh build path
-    monkeypatch.setattr(index, "_INDEX", None)
+    settings_override(rag_corpus_dir=str(corpus_dir), rag_index_dir=str(index_dir))
 
     built = index.build_or_load_index()
     assert isinstance(built, DummyIndex)
@@ -1,7 +1,21 @@
-"""TeleOps entry point - immediately redirects to Incident Generator."""
+"""TeleOps entry point - routes to the dashboard pages.
+
+st.navigation serves the Incident Generator as the default page, so a fresh
+visit renders it directly instead of running a redirect script first. The
+pages render their own nav links, so the built-in menu stays hidden.
+
+`streamlit run` puts this directory on sys.path once at startup, which is
+what lets the views import the shared theme module directly.
+"""
 
 import streamlit as st
 
-# Hide this page from sidebar by not setting any page config with a title
-# and immediately redirecting
-st.switch_page("pages/1_Incident_Generator.py")
+page = st.navigation(
+    [
+        st.Page("views/1_Incident_Generator.py", title="Incident Generator", default=True),
+        st.Page("views/3_LLM_Trace.py", title="LLM Trace"),
+        st.Page("views/2_Observability.py", title="Observability"),
+    ],
+    position="hidden",
+)
+page.run()
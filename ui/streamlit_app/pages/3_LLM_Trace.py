@@ -1,178 +0,0 @@
-"""TeleOps LLM Response Viewer."""
-
-import os
-import streamlit as st
-
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from theme import inject_theme, hero, divider, nav_links, badge, empty_state, safe_api_call, safe_json, check_api_connection
-
-API_URL = os.getenv("TELEOPS_API_URL") or os.getenv("API_BASE_URL", "http://localhost:8000")
-API_TOKEN = os.getenv("TELEOPS_API_TOKEN", "")
-TENANT_ID = os.getenv("TELEOPS_TENANT_ID", "")
-REQUEST_HEADERS = {}
-if API_TOKEN:
-    REQUEST_HEADERS["X-API-Key"] = API_TOKEN
-if TENANT_ID:
-    REQUEST_HEADERS["X-Tenant-Id"] = TENANT_ID
-
-st.set_page_config(page_title="LLM Response Viewer", layout="wide")
-inject_theme()
-check_api_connection(API_URL, REQUEST_HEADERS)
-
-nav_links([
-    ("Incident Generator", "pages/1_Incident_Generator.py", False),
-    ("LLM Trace", "pages/3_LLM_Trace.py", True),
-    ("Observability", "pages/2_Observability.py", False),
-], position="end")
-
-st.write("")
-
-hero(
-    title="LLM Request / Response Viewer",
-    subtitle="Inspect prompt inputs, RAG context, and structured output for debugging.",
-    chip_text="LLM TRACE",
-)
-
-st.write("")
-
-incidents_resp, incidents_err = safe_api_call("GET", f"{API_URL}/incidents", headers=REQUEST_HEADERS, timeout=30)
-if incidents_err:
-    st.error(incidents_err)
-    st.stop()
-
-incidents = safe_json(incidents_resp, [])
-if not isinstance(incidents, list):
-    incidents = []
-if not incidents:
-    empty_state("No incidents available. Generate a scenario first.", "")
-    st.stop()
-
-selected = st.selectbox("Select Incident", options=incidents, format_func=lambda i: f"{i['id'].rsplit('_', 2)[0]} - {i.get('summary', 'No summary')[:50]}")
-
-artifact_resp, artifact_err = safe_api_call(
-    "GET",
-    f"{API_URL}/rca/{selected['id']}/latest",
-    params={"source": "llm"},
-    headers=REQUEST_HEADERS,
-    timeout=30,
-)
-
-if artifact_err:
-    # Check if it was a 404 (no RCA yet) vs a real error
-    if artifact_err.startswith("[404]"):
-        st.warning("No LLM RCA found for this incident.")
-        if st.button("Run LLM RCA", type="primary"):
-            with st.spinner("Running LLM RCA (may take up to 2 minutes)..."):
-                run_resp, run_err = safe_api_call("POST", f"{API_URL}/rca/{selected['id']}/llm", headers=REQUEST_HEADERS, timeout=180)
-            if run_err:
-                st.error(run_err)
-            else:
-                st.rerun()
-        st.stop()
-    else:
-        st.error(artifact_err)
-        st.stop()
-
-artifact = safe_json(artifact_resp, {})
-if not isinstance(artifact, dict) or not artifact:
-    st.error("Could not parse RCA artifact response.")
-    st.stop()
-evidence = artifact.get("evidence", {})
-
-# Support both new format (llm_request/llm_response) and legacy format (flat fields)
-llm_request = evidence.get("llm_request", {})
-llm_response = evidence.get("llm_response", {})
-rag_query = evidence.get("rag_query", "N/A")
-alerts_count = evidence.get("alerts_count", 0)
-rag_chunks_used = evidence.get("rag_chunks_used", 0)
-
-left, right = st.columns(2, gap="large")
-
-with left:
-    st.markdown(
-        """
-        <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 16px;">
-            <h4 style="margin: 0; font-size: 16px; font-weight: 600; color: var(--ink-strong);">LLM Request</h4>
-            <span style="font-size: 12px; color: var(--ink-dim);">Input sent to model</span>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    # RAG query used for retrieval
-    st.markdown("**RAG Query**")
-    st.code(rag_query if isinstance(rag_query, str) else str(rag_query), language=None)
-
-    st.caption(f"Alerts analyzed: **{alerts_count}** | RAG chunks used: **{rag_chunks_used}**")
-
-    divider()
-
-    if llm_request:
-        # New format: full request payload available
-        st.markdown("**Incident Context**")
-        st.json(llm_request.get("incident", {}))
-
-        divider()
-
-        st.markdown("**Alerts Sample**")
-        alerts = llm_request.get("alerts_sample", [])
-        if alerts:
-            st.json(alerts[:5])
-            if len(alerts) > 5:
-                st.caption(f"+ {len(alerts) - 5} more alerts")
-        else:
-            st.markdown("<p style='color: var(--ink-dim);'>No alerts recorded</p>", unsafe_allow_html=True)
-
-        divider()
-
-        st.markdown("**RAG Context**")
-        rag = llm_request.get("rag_context", [])
-        if rag:
-            for idx, chunk in enumerate(rag if isinstance(rag, list) else [rag], 1):
-                st.markdown(f"**Chunk {idx}:**")
-                chunk_text = chunk[:300] if isinstance(chunk, str) else str(chunk)[:300]
-                st.markdown(f"<div style='background: var(--bg); padding: 12px; border-radius: 8px; font-size: 13px; color: var(--ink-muted); margin-bottom: 8px;'>{chunk_text}{'...' if len(str(chunk)) > 300 else ''}</div>", unsafe_allow_html=True)
-        else:
-            st.markdown("<p style='color: var(--ink-dim);'>No RAG context</p>", unsafe_allow_html=True)
-    else:
-        # Legacy format: only flat evidence fields available
-        st.info("Detailed request payload not captured for this artifact. Showing summary fields only.")
-        llm_evidence = evidence.get("llm_evidence", {})
-        if llm_evidence:
-            st.markdown("**LLM Evidence**")
-            st.json(llm_evidence)
-
-with right:
-    st.markdown(
-        """
-        <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 16px;">
-            <div style="display: flex; align-items: center; gap: 12px;">
-                <h4 style="margin: 0; font-size: 16px; font-weight: 600; color: var(--ink-strong);">LLM Response</h4>
-                <span style="font-size: 12px; color: var(--ink-dim);">Structured output</span>
-            </div>
-            <span style="background: linear-gradient(135deg, #6C5CE7, #A29BFE); color: white; font-size: 10px; font-weight: 600; padding: 4px 10px; border-radius: 4px; letter-spacing: 0.05em;">AI-POWERED</span>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    if llm_response:
-        st.markdown(f"{badge(artifact.get('model', 'unknown'), 'accent')} &nbsp; {badge(artifact.get('generated_at', '')[:19], 'muted')}", unsafe_allow_html=True)
-        st.write("")
-        st.json(llm_response)
-    elif artifact.get("hypotheses"):
-        # Fallback: show hypotheses from the artifact directly
-        st.markdown(f"{badge(artifact.get('model', 'unknown'), 'accent')} &nbsp; {badge(artifact.get('generated_at', '')[:19], 'muted')}", unsafe_allow_html=True)
-        st.write("")
-        st.markdown("**Hypotheses**")
-        st.json(artifact["hypotheses"])
-        if artifact.get("confidence_scores"):
-            st.markdown("**Confidence Scores**")
-            st.json(artifact["confidence_scores"])
-    else:
-        st.markdown("<p style='color: var(--ink-dim); text-align: center; padding: 20px;'>No response recorded</p>", unsafe_allow_html=True)
-
-# Raw evidence expander for debugging
-with st.expander("Raw Evidence JSON"):
-    st.json(evidence)
@@ -4,690 +4,80 @@ This module provides consistent styling across all pages with a NOC-inspired
 dark theme, custom components, and utility functions.
 """
 
-# CSS Variables and Theme Configuration
-THEME_CSS = """
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Outfit:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap');
-
-:root {
-    /* Core palette */
-    --bg-deep: #070B0E;
-    --bg: #0B1318;
-    --bg-elevated: #101920;
-    --panel: #131D24;
-    --panel-hover: #182530;
-
-    /* Text */
-    --ink: #E8F4FC;
-    --ink-strong: #FFFFFF;
-    --ink-muted: #8BA3B5;
-    --ink-dim: #5A7384;
-
-    /* Accents */
-    --accent: #00D4AA;
-    --accent-glow: rgba(0, 212, 170, 0.15);
-    --accent-2: #FF9F43;
-    --accent-2-glow: rgba(255, 159, 67, 0.15);
-    --accent-3: #6C5CE7;
-
-    /* Semantic */
-    --critical: #FF6B6B;
-    --critical-glow: rgba(255, 107, 107, 0.2);
-    --warning: #FECA57;
-    --success: #1DD1A1;
-    --info: #54A0FF;
-
-    /* Borders & Shadows */
-    --border: #1E2D38;
-    --border-hover: #2A4050;
-    --shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-    --shadow-glow: 0 0 40px rgba(0, 212, 170, 0.1);
-}
-
-/* Base styles */
-html, body, [data-testid="stAppViewContainer"], .main {
-    background: var(--bg-deep) !important;
-    color: var(--ink) !important;
-    font-family: 'Outfit', -apple-system, sans-serif !important;
-}
-
-/* Typography */
-h1, h2, h3, h4, h5, h6 {
-    font-family: 'Outfit', sans-serif !important;
-    color: var(--ink-strong) !important;
-    font-weight: 600 !important;
-    letter-spacing: -0.02em;
-}
-
-code, pre, .stCode {
-    font-family: 'JetBrains Mono', monospace !important;
-}
-
-/* Sidebar styling */
-[data-testid="stSidebar"] {
-    background: linear-gradient(180deg, var(--panel) 0%, var(--bg) 100%) !important;
-    border-right: 1px solid var(--border) !important;
-}
-
-[data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
-    color: var(--ink) !important;
-}
-
-[data-testid="stSidebar"] .stSelectbox label,
-[data-testid="stSidebar"] .stNumberInput label {
-    color: var(--ink-muted) !important;
-    font-size: 13px !important;
-    font-weight: 500 !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.05em !important;
-}
-
-/* Form elements */
-.stSelectbox > div > div,
-.stNumberInput > div > div > input,
-.stTextInput > div > div > input {
-    background: var(--bg) !important;
-    border: 1px solid var(--border) !important;
-    border-radius: 8px !important;
-    color: var(--ink) !important;
-}
-
-.stSelectbox > div > div:hover,
-.stNumberInput > div > div > input:hover {
-    border-color: var(--border-hover) !important;
-}
-
-.stSelectbox > div > div:focus-within,
-.stNumberInput > div > div > input:focus {
-    border-color: var(--accent) !important;
-    box-shadow: 0 0 0 2px var(--accent-glow) !important;
-}
-
-/* Primary button */
-.stButton > button[kind="primary"],
-.stButton > button {
-    background: linear-gradient(135deg, var(--accent) 0%, #00B894 100%) !important;
-    color: var(--bg-deep) !important;
-    border: none !important;
-    border-radius: 10px !important;
-    font-family: 'Outfit', sans-serif !important;
-    font-weight: 600 !important;
-    font-size: 14px !important;
-    padding: 12px 24px !important;
-    transition: all 0.2s ease !important;
-    box-shadow: 0 4px 12px rgba(0, 212, 170, 0.3) !important;
-}
-
-.stButton > button:hover {
-    transform: translateY(-1px) !important;
-    box-shadow: 0 6px 20px rgba(0, 212, 170, 0.4) !important;
-}
-
-/* Secondary/ghost button */
-.teleops-btn-secondary button {
-    background: transparent !important;
-    border: 1px solid var(--border) !important;
-    color: var(--ink-muted) !important;
-    box-shadow: none !important;
-}
-
-.teleops-btn-secondary button:hover {
-    border-color: var(--accent) !important;
-    color: var(--accent) !important;
-    background: var(--accent-glow) !important;
-}
-
-/* Metrics */
-[data-testid="stMetric"] {
-    background: var(--panel) !important;
-    border: 1px solid var(--border) !important;
-    border-radius: 12px !important;
-    padding: 16px !important;
-}
-
-[data-testid="stMetric"] label {
-    color: var(--ink-muted) !important;
-    font-size: 12px !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.08em !important;
-}
-
-[data-testid="stMetric"] [data-testid="stMetricValue"] {
-    color: var(--ink-strong) !important;
-    font-family: 'JetBrains Mono', monospace !important;
-    font-size: 28px !important;
-    font-weight: 600 !important;
-}
-
-/* Dataframe */
-.stDataFrame {
-    border: 1px solid var(--border) !important;
-    border-radius: 8px !important;
-    overflow: hidden !important;
-}
-
-.stDataFrame [data-testid="stDataFrameResizable"] {
-    background: var(--panel) !important;
-}
-
-/* Expander */
-.streamlit-expanderHeader {
-    background: var(--panel) !important;
-    border: 1px solid var(--border) !important;
-    border-radius: 8px !important;
-    color: var(--ink) !important;
-}
-
-.streamlit-expanderContent {
-    background: var(--bg) !important;
-    border: 1px solid var(--border) !important;
-    border-top: none !important;
-    border-radius: 0 0 8px 8px !important;
-}
-
-/* JSON viewer */
-.stJson {
-    background: var(--bg) !important;
-    border: 1px solid var(--border) !important;
-    border-radius: 8px !important;
-    padding: 12px !important;
-}
-
-/* Divider */
-hr {
-    border-color: var(--border) !important;
-    margin: 24px 0 !important;
-}
-
-/* Info/Warning/Error boxes */
-.stAlert {
-    border-radius: 8px !important;
-    border: none !important;
-}
-
-/* Multiselect */
-.stMultiSelect > div > div {
-    background: var(--bg) !important;
-    border: 1px solid var(--border) !important;
-    border-radius: 8px !important;
-}
-
-.stMultiSelect [data-baseweb="tag"] {
-    background: var(--accent-glow) !important;
-    border: 1px solid var(--accent) !important;
-    color: var(--accent) !important;
-}
-
-/* Caption */
-.stCaption {
-    color: var(--ink-dim) !important;
-}
-
-/* === CUSTOM COMPONENT CLASSES === */
-
-/* Hero section */
-.teleops-hero {
-    padding: 28px 32px;
-    border-radius: 20px;
-    background:
-        radial-gradient(ellipse at 20% 0%, rgba(0, 212, 170, 0.12) 0%, transparent 50%),
-        radial-gradient(ellipse at 80% 100%, rgba(255, 159, 67, 0.08) 0%, transparent 40%),
-        linear-gradient(160deg, var(--panel) 0%, var(--bg) 100%);
-    border: 1px solid var(--border);
-    position: relative;
-    overflow: hidden;
-}
-
-.teleops-hero::before {
-    content: "";
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    height: 1px;
-    background: linear-gradient(90deg, transparent, var(--accent), transparent);
-    opacity: 0.5;
-}
-
-.teleops-hero h1 {
-    margin: 0;
-    font-size: 32px;
-    font-weight: 700;
-    background: linear-gradient(135deg, var(--ink-strong) 0%, var(--ink) 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-clip: text;
-}
-
-.teleops-hero p {
-    margin: 8px 0 0 0;
-    color: var(--ink-muted);
-    font-size: 15px;
-    line-height: 1.5;
-}
-
-/* Chip/Tag */
-.teleops-chip {
-    display: inline-flex;
-    align-items: center;
-    gap: 6px;
-    padding: 5px 12px;
-    border-radius: 20px;
-    font-size: 11px;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-    font-family: 'JetBrains Mono', monospace;
-    background: linear-gradient(135deg, var(--accent-glow) 0%, transparent 100%);
-    color: var(--accent);
-    border: 1px solid rgba(0, 212, 170, 0.3);
-    margin-bottom: 12px;
-}
-
-.teleops-chip::before {
-    content: "";
-    width: 6px;
-    height: 6px;
-    background: var(--accent);
-    border-radius: 50%;
-    animation: pulse 2s infinite;
-}
-
-@keyframes pulse {
-    0%, 100% { opacity: 1; box-shadow: 0 0 0 0 var(--accent); }
-    50% { opacity: 0.7; box-shadow: 0 0 0 4px transparent; }
-}
-
-/* Card */
-.teleops-card {
-    background: var(--panel);
-    border: 1px solid var(--border);
-    border-radius: 16px;
-    padding: 20px 24px;
-    box-shadow: var(--shadow);
-    transition: all 0.2s ease;
-}
-
-.teleops-card:hover {
-    border-color: var(--border-hover);
-}
-
-.teleops-card-accent {
-    border-left: 3px solid var(--accent);
-    background: linear-gradient(90deg, var(--accent-glow) 0%, var(--panel) 30%);
-}
-
-.teleops-card-warning {
-    border-left: 3px solid var(--accent-2);
-    background: linear-gradient(90deg, var(--accent-2-glow) 0%, var(--panel) 30%);
-}
-
-.teleops-card-critical {
-    border-left: 3px solid var(--critical);
-    background: linear-gradient(90deg, var(--critical-glow) 0%, var(--panel) 30%);
-}
-
-/* Card header */
-.teleops-card-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    margin-bottom: 16px;
-    padding-bottom: 12px;
-    border-bottom: 1px solid var(--border);
-}
-
-.teleops-card-title {
-    font-size: 16px;
-    font-weight: 600;
-    color: var(--ink-strong);
-    margin: 0;
-}
-
-.teleops-card-subtitle {
-    font-size: 13px;
-    color: var(--ink-dim);
-    margin: 4px 0 0 0;
-}
-
-/* Badge */
-.teleops-badge {
-    display: inline-flex;
-    align-items: center;
-    padding: 4px 10px;
-    border-radius: 6px;
-    font-size: 12px;
-    font-weight: 500;
-    font-family: 'JetBrains Mono', monospace;
-}
-
-.teleops-badge-accent {
-    background: var(--accent-glow);
-    color: var(--accent);
-    border: 1px solid rgba(0, 212, 170, 0.3);
-}
-
-.teleops-badge-muted {
-    background: rgba(139, 163, 181, 0.1);
-    color: var(--ink-muted);
-    border: 1px solid var(--border);
-}
-
-/* Severity indicators */
-.teleops-severity {
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    font-weight: 600;
-    font-size: 14px;
-}
-
-.teleops-severity-dot {
-    width: 10px;
-    height: 10px;
-    border-radius: 50%;
-}
-
-.teleops-severity-critical .teleops-severity-dot {
-    background: var(--critical);
-    box-shadow: 0 0 12px var(--critical);
-    animation: critical-pulse 1.5s infinite;
-}
-
-@keyframes critical-pulse {
-    0%, 100% { box-shadow: 0 0 0 0 rgba(255, 107, 107, 0.6); }
-    50% { box-shadow: 0 0 0 8px rgba(255, 107, 107, 0); }
-}
-
-.teleops-severity-critical { color: var(--critical); }
-.teleops-severity-high { color: var(--accent-2); }
-.teleops-severity-medium { color: var(--warning); }
-.teleops-severity-low { color: var(--success); }
-
-/* Stats bar */
-.teleops-stats-bar {
-    display: flex;
-    gap: 24px;
-    padding: 16px 20px;
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 12px;
-    margin-bottom: 20px;
-}
-
-.teleops-stat {
-    display: flex;
-    flex-direction: column;
-    gap: 4px;
-}
-
-.teleops-stat-value {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 24px;
-    font-weight: 600;
-    color: var(--ink-strong);
-}
-
-.teleops-stat-label {
-    font-size: 11px;
-    color: var(--ink-dim);
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-}
-
-/* Navigation links */
-.teleops-nav {
-    display: flex;
-    gap: 16px;
-    justify-content: flex-end;
-}
-
-.teleops-nav a {
-    color: var(--ink-muted);
-    text-decoration: none;
-    font-size: 13px;
-    font-weight: 500;
-    padding: 6px 12px;
-    border-radius: 6px;
-    transition: all 0.2s ease;
-}
-
-.teleops-nav a:hover {
-    color: var(--accent);
-    background: var(--accent-glow);
-}
-
-.teleops-nav a.active {
-    color: var(--accent);
-    background: var(--accent-glow);
-}
-
-/* Divider */
-.teleops-divider {
-    height: 1px;
-    background: linear-gradient(90deg, transparent, var(--border), transparent);
-    margin: 16px 0;
-}
-
-/* RCA comparison columns */
-.teleops-rca-baseline {
-    background: var(--panel);
-    border: 1px solid var(--border);
-    border-radius: 16px;
-    padding: 20px;
-}
-
-.teleops-rca-llm {
-    background: linear-gradient(135deg, var(--panel) 0%, rgba(108, 92, 231, 0.05) 100%);
-    border: 1px solid rgba(108, 92, 231, 0.3);
-    border-radius: 16px;
-    padding: 20px;
-    position: relative;
-}
-
-.teleops-rca-llm::before {
-    content: "AI-POWERED";
-    position: absolute;
-    top: -10px;
-    right: 20px;
-    background: linear-gradient(135deg, #6C5CE7, #A29BFE);
-    color: white;
-    font-size: 10px;
-    font-weight: 600;
-    padding: 4px 10px;
-    border-radius: 4px;
-    letter-spacing: 0.05em;
-}
-
-/* Progress/gauge styling */
-.teleops-gauge-container {
-    display: flex;
-    align-items: center;
-    gap: 16px;
-    padding: 12px 0;
-    border-bottom: 1px solid var(--border);
-}
-
-.teleops-gauge-container:last-child {
-    border-bottom: none;
-}
-
-/* Page header with breadcrumb */
-.teleops-page-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 12px 0;
-    margin-bottom: 20px;
-}
-
-.teleops-breadcrumb {
-    display: flex;
-    align-items: center;
-    gap: 8px;
-    font-size: 13px;
-    color: var(--ink-dim);
-}
-
-.teleops-breadcrumb a {
-    color: var(--ink-muted);
-    text-decoration: none;
-}
-
-.teleops-breadcrumb a:hover {
-    color: var(--accent);
-}
-
-/* Metric cards for observability */
-.teleops-metric-card {
-    background: var(--panel);
-    border: 1px solid var(--border);
-    border-radius: 12px;
-    padding: 20px;
-    text-align: center;
-    transition: all 0.2s ease;
-}
-
-.teleops-metric-card:hover {
-    border-color: var(--accent);
-    box-shadow: var(--shadow-glow);
-}
-
-.teleops-metric-value {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 36px;
-    font-weight: 700;
-    color: var(--accent);
-    line-height: 1;
-}
-
-.teleops-metric-label {
-    font-size: 12px;
-    color: var(--ink-muted);
-    text-transform: uppercase;
-    letter-spacing: 0.08em;
-    margin-top: 8px;
-}
-
-/* Progress bar for test results */
-.teleops-progress {
-    height: 8px;
-    background: var(--bg);
-    border-radius: 4px;
-    overflow: hidden;
-    margin: 8px 0;
-}
-
-.teleops-progress-fill {
-    height: 100%;
-    border-radius: 4px;
-    transition: width 0.5s ease;
-}
-
-.teleops-progress-success {
-    background: linear-gradient(90deg, var(--success), #10B981);
-}
-
-.teleops-progress-warning {
-    background: linear-gradient(90deg, var(--warning), #F59E0B);
-}
-
-/* Code block styling */
-.teleops-code {
-    background: var(--bg);
-    border: 1px solid var(--border);
-    border-radius: 8px;
-    padding: 16px;
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 13px;
-    color: var(--ink);
-    overflow-x: auto;
-    line-height: 1.6;
-}
-
-/* Timestamp styling */
-.teleops-timestamp {
-    font-family: 'JetBrains Mono', monospace;
-    font-size: 12px;
-    color: var(--ink-dim);
-}
-
-/* Empty state */
-.teleops-empty {
-    text-align: center;
-    padding: 48px 24px;
-    color: var(--ink-dim);
-}
-
-.teleops-empty-icon {
-    font-size: 48px;
-    margin-bottom: 16px;
-    opacity: 0.5;
-}
-
-/* Loading state */
-.teleops-loading {
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    gap: 8px;
-    padding: 24px;
-    color: var(--ink-muted);
-}
+import html
+import json
+import os
+import re
+import textwrap
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of API responses
+    orjson = None
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    Deliberately conservative: whitespace next to ':' is kept, since in a
+    selector it can be a descendant combinator (``.a :hover``).
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
 
-.teleops-spinner {
-    width: 20px;
-    height: 20px;
-    border: 2px solid var(--border);
-    border-top-color: var(--accent);
-    border-radius: 50%;
-    animation: spin 1s linear infinite;
-}
 
-@keyframes spin {
-    to { transform: rotate(360deg); }
-}
-</style>
-"""
+# CSS variables and component styles live in theme.css. Read and minified once
+# at import; inject_theme() re-emits the same string on each full rerun because
+# Streamlit removes any element a rerun does not produce again.
+THEME_CSS = "<style>" + _minify_css((Path(__file__).parent / "theme.css").read_text(encoding="utf-8")) + "</style>"
 
 
 def inject_theme() -> None:
     """Inject the TeleOps theme CSS into the Streamlit page."""
-    import streamlit as st
     st.markdown(THEME_CSS, unsafe_allow_html=True)
 
 
 def hero(title: str, subtitle: str, chip_text: str = "TELEOPS") -> None:
     """Render the hero/header section."""
-    import streamlit as st
     st.markdown(
-        f"""
-        <div class="teleops-hero">
-            <span class="teleops-chip">{chip_text}</span>
-            <h1>{title}</h1>
-            <p>{subtitle}</p>
-        </div>
-        """,
+        f'<div class="teleops-hero"><span class="teleops-chip">{chip_text}</span>'
+        f"<h1>{title}</h1><p>{subtitle}</p></div>",
         unsafe_allow_html=True,
     )
 
 
+_CARD_START_HTML = {
+    "": '<div class="teleops-card">',
+    "accent": '<div class="teleops-card teleops-card-accent">',
+    "warning": '<div class="teleops-card teleops-card-warning">',
+    "critical": '<div class="teleops-card teleops-card-critical">',
+}
+_CARD_END_HTML = "</div>"
+
+
 def card_start(variant: str = "") -> None:
     """Start a card container. Variants: '', 'accent', 'warning', 'critical'."""
-    import streamlit as st
-    cls = f"teleops-card teleops-card-{variant}" if variant else "teleops-card"
-    st.markdown(f'<div class="{cls}">', unsafe_allow_html=True)
+    start = _CARD_START_HTML.get(variant) or f'<div class="teleops-card teleops-card-{variant}">'
+    st.markdown(start, unsafe_allow_html=True)
 
 
 def card_end() -> None:
     """End a card container."""
-    import streamlit as st
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown(_CARD_END_HTML, unsafe_allow_html=True)
 
 
 def card_header(title: str, subtitle: str = "") -> None:
     """Render a card header with title and optional subtitle."""
-    import streamlit as st
     subtitle_html = f'<p class="teleops-card-subtitle">{subtitle}</p>' if subtitle else ""
     st.markdown(
         f"""
@@ -702,25 +92,42 @@ def card_header(title: str, subtitle: str = "") -> None:
     )
 
 
+def section_header(title: str, subtitle: str = "") -> None:
+    """Render a page section heading with an optional muted subtitle.
+
+    The top margin comes from the ``teleops-section-header`` class, so pages
+    don't need a blank spacer element before each section.
+    """
+    subtitle_html = f"<span>{subtitle}</span>" if subtitle else ""
+    st.markdown(
+        f'<div class="teleops-section-header"><h3>{title}</h3>{subtitle_html}</div>',
+        unsafe_allow_html=True,
+    )
+
+
+DIVIDER_HTML = '<div class="teleops-divider"></div>'
+
+
 def divider() -> None:
     """Render a styled divider."""
-    import streamlit as st
-    st.markdown('<div class="teleops-divider"></div>', unsafe_allow_html=True)
+    st.markdown(DIVIDER_HTML, unsafe_allow_html=True)
 
 
 def severity_badge(severity: str) -> str:
     """Return HTML for a severity indicator."""
-    sev_lower = (severity or "unknown").lower()
-    return f"""
-    <span class="teleops-severity teleops-severity-{sev_lower}">
-        <span class="teleops-severity-dot"></span>
-        {severity.upper() if severity else "UNKNOWN"}
-    </span>
-    """
+    sev_lower = html.escape((severity or "unknown").lower())
+    label = html.escape(severity.upper()) if severity else "UNKNOWN"
+    return (
+        f'<span class="teleops-severity teleops-severity-{sev_lower}">'
+        f'<span class="teleops-severity-dot"></span>{label}</span>'
+    )
 
 
 def badge(text: str, variant: str = "accent") -> str:
-    """Return HTML for a badge. Variants: 'accent', 'muted'."""
+    """Return HTML for a badge. Variants: 'accent', 'muted'.
+
+    ``text`` is inserted as-is; callers escape server-provided values.
+    """
     return f'<span class="teleops-badge teleops-badge-{variant}">{text}</span>'
 
 
@@ -728,10 +135,8 @@ def nav_links(links: list[tuple[str, str, bool]], position: str = "right") -> No
     """Render navigation links using Streamlit's native page_link.
 
     Each tuple is (label, page_path, is_active) where page_path is
-    the relative path to the .py file, e.g. 'pages/2_Observability.py'.
+    the relative path to the .py file, e.g. 'views/2_Observability.py'.
     """
-    import streamlit as st
-
     # Use columns for horizontal layout
     cols = st.columns([1] * len(links) + [3] if position == "start" else [3] + [1] * len(links))
     start_idx = 0 if position == "start" else 1
@@ -750,40 +155,43 @@ def nav_links(links: list[tuple[str, str, bool]], position: str = "right") -> No
 def metric_card(value: str | int | float, label: str, color: str = "accent") -> str:
     """Return HTML for a large metric card."""
     color_var = f"var(--{color})" if not color.startswith("#") else color
-    return f"""
-    <div class="teleops-metric-card">
-        <div class="teleops-metric-value" style="color: {color_var};">{value}</div>
-        <div class="teleops-metric-label">{label}</div>
-    </div>
-    """
+    return (
+        '<div class="teleops-metric-card">'
+        f'<div class="teleops-metric-value" style="color: {color_var};">{value}</div>'
+        f'<div class="teleops-metric-label">{label}</div>'
+        "</div>"
+    )
 
 
-def progress_bar(percent: float, variant: str = "success") -> str:
-    """Return HTML for a progress bar. Variants: 'success', 'warning'."""
-    return f"""
-    <div class="teleops-progress">
-        <div class="teleops-progress-fill teleops-progress-{variant}"
-             style="width: {min(max(percent, 0), 100)}%;"></div>
-    </div>
+def metric_grid(cards: list[str]) -> str:
+    """Return HTML laying out metric_card() fragments as one equal-width row.
+
+    Lets a page emit a whole row of cards with a single st.markdown call
+    instead of one call per st.columns cell.
     """
+    return (
+        f'<div class="teleops-metric-grid" style="grid-template-columns: repeat({len(cards)}, minmax(0, 1fr));">'
+        f'{"".join(cards)}</div>'
+    )
 
 
-def confidence_gauge(value: float, label: str) -> str:
-    """Return HTML for confidence gauge visualization."""
-    level = min(max(float(value), 0.0), 1.0)
+def progress_bar(percent: float, variant: str = "success") -> str:
+    """Return HTML for a progress bar. Variants: 'success', 'warning'.
 
-    if level >= 0.8:
-        color = "#1DD1A1"
-    elif level >= 0.6:
-        color = "#00D4AA"
-    elif level >= 0.4:
-        color = "#FECA57"
-    else:
-        color = "#FF6B6B"
+    Kept on one line so it can be joined with markdown text in a single
+    st.markdown call without breaking the HTML block.
+    """
+    return (
+        f'<div class="teleops-progress"><div class="teleops-progress-fill teleops-progress-{variant}" '
+        f'style="width: {min(max(percent, 0), 100)}%;"></div></div>'
+    )
 
-    arc = 157 * level
 
-    return f"""
+# Parsed once; filled per gauge with format_map. The label is escaped
+# because hypothesis text comes straight from the LLM response. Dedented and
+# stripped so a batch of gauges forms one markdown HTML block (a blank or
+# indented line between gauges would start a code block).
+_GAUGE_TEMPLATE = textwrap.dedent("""
     <div class="teleops-gauge-container">
         <svg width="100" height="60" viewBox="0 0 100 60">
             <path d="M10,55 A40,40 0 0,1 90,55"
@@ -793,18 +201,64 @@ def confidence_gauge(value: float, label: str) -> str:
                   stroke-dasharray="{arc} 999" style="filter: drop-shadow(0 0 6px {color});"/>
             <text x="50" y="48" text-anchor="middle"
                   font-family="JetBrains Mono" font-size="18" font-weight="600"
-                  fill="{color}">{level:.0%}</text>
+                  fill="{color}">{level}</text>
         </svg>
         <div style="flex:1; color: var(--ink); font-size: 14px; line-height: 1.4;">
             {label}
         </div>
     </div>
+    """).strip()
+
+
+# Gauge color bands: below 0.4, 0.4-0.6, 0.6-0.8, 0.8 and above
+_CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+_CONFIDENCE_COLORS = ("#FF6B6B", "#FECA57", "#00D4AA", "#1DD1A1")
+
+
+def _confidence_color(level: float) -> str:
+    """Return the gauge color for a confidence level in [0, 1]."""
+    return _CONFIDENCE_COLORS[bisect_right(_CONFIDENCE_THRESHOLDS, level)]
+
+
+@lru_cache(maxsize=256)
+def confidence_gauge(value: float, label: str) -> str:
+    """Return HTML for one confidence gauge.
+
+    Memoized: RCA payloads live in session state, so every rerun asks for
+    the same (value, label) pairs again.
     """
+    level = min(max(float(value), 0.0), 1.0)
+    color = _confidence_color(level)
+
+    return _GAUGE_TEMPLATE.format_map(
+        {
+            "color": color,
+            "arc": f"{157 * level:.2f}",
+            "level": f"{level:.0%}",
+            "label": html.escape(str(label), quote=True),
+        }
+    )
+
+
+def confidence_gauges(scores: dict) -> str:
+    """Return HTML for a batch of confidence gauges, one per (label, value) item.
+
+    The gauges are joined into one string so a page renders them all with a
+    single st.markdown call.
+    """
+    return "".join(confidence_gauge(value, label) for label, value in scores.items())
+
 
+def _is_html(text: str | bytes) -> bool:
+    """Check if text looks like an HTML page (e.g. Cloudflare error page).
 
-def _is_html(text: str) -> bool:
-    """Check if text looks like an HTML page (e.g. Cloudflare error page)."""
-    stripped = text.strip()[:100].lower()
+    Only the start of the body is inspected, so raw response bytes can be
+    passed without decoding the whole payload to str first.
+    """
+    head = text[:512]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", "ignore")
+    stripped = head.strip()[:100].lower()
     return stripped.startswith("<!doctype") or stripped.startswith("<html") or stripped.startswith("<!–")
 
 
@@ -812,11 +266,11 @@ def safe_error_message(resp) -> str:
     """Extract a human-readable error from an API response, handling HTML error pages."""
     try:
         content_type = resp.headers.get("content-type", "")
-        if "text/html" in content_type or _is_html(resp.text):
+        if "text/html" in content_type or _is_html(resp.content):
             return f"API returned HTTP {resp.status_code}. The backend may be unavailable."
         text = resp.text[:500]
         try:
-            data = resp.json()
+            data = _json_loads(resp.content)
             return data.get("detail", text)
         except Exception:
             return text
@@ -824,39 +278,217 @@ def safe_error_message(resp) -> str:
         return f"API returned HTTP {getattr(resp, 'status_code', 'unknown')}."
 
 
-def safe_api_call(method: str, url: str, **kwargs):
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+
+def _http_session():
+    """Return the process-wide requests.Session used for API calls.
+
+    Reusing one session keeps connections to the API alive across reruns
+    instead of opening a new TCP/TLS connection for every call. Headers are
+    still passed per call, so one session is safe to share between pages.
+
+    Transient 502/503/504 responses from a restarting API or proxy are
+    retried with exponential backoff, honouring Retry-After. Only GET and
+    HEAD are retried, so POSTs such as /generate are never replayed.
+    Failures to connect are retried for every method, since the request
+    never reached the API.
+
+    This module is imported once per process, so the global outlives script
+    reruns. It is not an st.cache_resource because it is also called from
+    worker threads that have no ScriptRunContext.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                session = requests.Session()
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+# Connecting to the API should be fast even when a handler is slow, so a
+# dead backend fails in seconds rather than after the full read timeout.
+API_CONNECT_TIMEOUT = 3.05
+
+
+def _split_timeout(kwargs: dict) -> dict:
+    """Turn a bare ``timeout=N`` into a (connect, read) tuple with a short connect limit."""
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, (int, float)):
+        kwargs["timeout"] = (min(API_CONNECT_TIMEOUT, timeout), timeout)
+    return kwargs
+
+
+def safe_api_call(method: str, url: str, *, retry: bool = True, **kwargs):
     """Make an API call with safe error handling. Returns (response, error_message).
 
     If the call succeeds and returns valid JSON-compatible content, returns (response, None).
     If it fails (HTTP error, HTML body, timeout, connection error), returns (None, error_string).
     Error strings for HTTP errors are prefixed with "[STATUS_CODE] " for programmatic checks.
+    A numeric ``timeout`` applies to reading the response; connecting is capped
+    at API_CONNECT_TIMEOUT. ``retry=False`` sends a single attempt outside the
+    shared session, so the timeout bounds the whole call.
     """
-    import requests as _requests
-
+    send = _http_session().request if retry else requests.request
     try:
-        resp = _requests.request(method, url, **kwargs)
+        resp = send(method, url, **_split_timeout(kwargs))
         if resp.status_code >= 400:
             msg = safe_error_message(resp)
             return None, f"[{resp.status_code}] {msg}"
         # Guard against 200 responses that are actually HTML error pages
         # (e.g. Cloudflare "Always Online" or proxy cache returning stale HTML)
-        if _is_html(resp.text):
+        if _is_html(resp.content):
             return None, "API returned an HTML page instead of JSON. The backend may be behind a proxy that is masking errors."
         return resp, None
-    except _requests.exceptions.Timeout:
+    except requests.exceptions.Timeout:
         return None, "Request timed out. The API may be under heavy load -- please retry."
-    except _requests.exceptions.ConnectionError:
+    except requests.exceptions.ConnectionError:
         return None, "Could not connect to the API. Please check that the backend is running."
-    except _requests.exceptions.RequestException as exc:
+    except requests.exceptions.RequestException as exc:
         return None, f"API request failed: {exc}"
 
 
+# Last (ETag, decoded body) per GET, for revalidating with If-None-Match.
+# Keyed by URL, params and headers, so tenants never share an entry.
+_ETAG_CACHE: dict[tuple, tuple[str, object]] = {}
+_ETAG_CACHE_LOCK = threading.Lock()
+
+
+def conditional_get_json(url: str, fallback=None, **kwargs):
+    """GET a JSON endpoint, revalidating the previous response with If-None-Match.
+
+    Returns (data, error_message). When the API answers 304 Not Modified the
+    body decoded last time is returned, so an unchanged resource is neither
+    transferred nor parsed again. Endpoints without an ETag behave like a
+    plain safe_api_call + safe_json.
+    """
+    headers = dict(kwargs.pop("headers", None) or {})
+    key = (url, tuple(sorted(headers.items())), tuple(sorted((kwargs.get("params") or {}).items())))
+    with _ETAG_CACHE_LOCK:
+        cached = _ETAG_CACHE.get(key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    resp, err = safe_api_call("GET", url, headers=headers, **kwargs)
+    if err:
+        return fallback, err
+    if resp.status_code == 304 and cached:
+        return cached[1], None
+    data = safe_json(resp, fallback)
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _ETAG_CACHE_LOCK:
+            _ETAG_CACHE[key] = (etag, data)
+    return data, None
+
+
+def stream_api_events(method: str, url: str, **kwargs):
+    """Yield events from an NDJSON streaming endpoint as they arrive.
+
+    Each line of the response body is decoded into a dict. HTTP and transport
+    failures are yielded as a final ``{"event": "error", "detail": ...}`` so
+    callers handle them the same way as errors reported by the stream itself.
+    """
+    try:
+        with _http_session().request(method, url, stream=True, **_split_timeout(kwargs)) as resp:
+            if resp.status_code >= 400:
+                yield {"event": "error", "detail": f"[{resp.status_code}] {safe_error_message(resp)}"}
+                return
+            for line in resp.iter_lines():
+                if line:
+                    yield _json_loads(line)
+    except ValueError:
+        yield {"event": "error", "detail": "API returned a malformed event stream."}
+    except requests.exceptions.Timeout:
+        yield {"event": "error", "detail": "Request timed out. The API may be under heavy load -- please retry."}
+    except requests.exceptions.ConnectionError:
+        yield {"event": "error", "detail": "Could not connect to the API. Please check that the backend is running."}
+    except requests.exceptions.RequestException as exc:
+        yield {"event": "error", "detail": f"API request failed: {exc}"}
+
+
+# Progress messages for the stage events of /rca/{id}/llm/stream
+RCA_STAGE_LABELS = {
+    "retrieving_context": "Retrieving runbook context...",
+    "generating": "Generating LLM hypotheses (may take up to 2 minutes)...",
+}
+
+
+# Longest wait for the next event from the LLM RCA stream, in seconds.
+# Generation is silent until the result, so this bounds the whole LLM call.
+LLM_RCA_TIMEOUT = float(os.getenv("TELEOPS_LLM_TIMEOUT", "180"))
+
+
+def run_llm_rca_stream(url: str, on_stage, **kwargs) -> tuple[dict | None, str | None]:
+    """POST to an /rca/{id}/llm/stream endpoint and return (payload, error).
+
+    ``on_stage`` is called with a progress message for each stage event (e.g.
+    an st.empty placeholder's ``info`` or a status box's label update), so the
+    user sees retrieval and generation as they start.
+
+    The read timeout defaults to LLM_RCA_TIMEOUT. Connection failures are
+    retried by the shared session; a timed-out generation is not re-sent,
+    since the API may still be producing (and storing) an artifact for it.
+    """
+    kwargs.setdefault("timeout", LLM_RCA_TIMEOUT)
+    payload, err = None, None
+    for event in stream_api_events("POST", url, **kwargs):
+        kind = event.get("event")
+        if kind == "stage":
+            on_stage(RCA_STAGE_LABELS.get(event.get("stage"), "Running LLM RCA..."))
+        elif kind == "result":
+            payload = event.get("data") or {}
+        elif kind == "error":
+            err = event.get("detail") or "unknown error"
+    if payload is None and err is None:
+        err = "stream ended without a result"
+    return payload, err
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def pretty_json(data) -> str:
+    """Serialize data as indented JSON text for st.code.
+
+    Used instead of st.json for large payloads: one pre-rendered block is
+    much cheaper to send and draw than st.json's interactive tree.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
 def safe_json(resp, fallback=None):
-    """Safely parse JSON from a response, returning fallback if it fails."""
+    """Safely parse JSON from a response, returning fallback if it fails.
+
+    When ``fallback`` is a list or dict, the decoded value must have the same
+    type; anything else (e.g. an error object where a list was expected) also
+    returns ``fallback``, so callers don't need their own isinstance checks.
+    """
     try:
-        return resp.json()
+        data = _json_loads(resp.content)
     except Exception:
         return fallback
+    if isinstance(fallback, (list, dict)) and not isinstance(data, type(fallback)):
+        return fallback
+    return data
 
 
 def _hashable_headers(headers: dict | None) -> tuple:
@@ -866,24 +498,25 @@ def _hashable_headers(headers: dict | None) -> tuple:
     return tuple(sorted(headers.items()))
 
 
+# Health probes are cheap and only gate page rendering, so they fail fast:
+# one attempt, no session retries
+HEALTH_PROBE_TIMEOUT = 3
+
+
+@st.cache_data(ttl=30, show_spinner=False)
 def _probe_api_health(api_url: str, headers_key: tuple) -> tuple[bool, str]:
     """Internal health probe. Returns (ok, error_message).
 
-    Cached at module import time so every Streamlit rerun does NOT issue a
+    Cached for 30 seconds so every Streamlit rerun does NOT issue a
     fresh /health request to the backend API. On Railway serverless this
     change alone meaningfully reduces how often the API container is kept
     warm -- without a cache, every tab switch and form interaction fired
     a /health call, preventing scale-to-zero.
     """
-    import streamlit as st
-
-    @st.cache_data(ttl=30, show_spinner=False)
-    def _cached(api_url_inner: str, headers_key_inner: tuple) -> tuple[bool, str]:
-        hdrs = dict(headers_key_inner)
-        resp, err_inner = safe_api_call("GET", f"{api_url_inner}/health", headers=hdrs, timeout=10)
-        return (err_inner is None, err_inner or "")
-
-    return _cached(api_url, headers_key)
+    _resp, err = safe_api_call(
+        "GET", f"{api_url}/health", headers=dict(headers_key), timeout=HEALTH_PROBE_TIMEOUT, retry=False
+    )
+    return (err is None, err or "")
 
 
 def check_api_connection(api_url: str, headers: dict | None = None) -> bool:
@@ -894,8 +527,6 @@ def check_api_connection(api_url: str, headers: dict | None = None) -> bool:
     Result is cached for 30 seconds per (api_url, headers) pair. To force a
     fresh probe call `st.cache_data.clear()` from the caller.
     """
-    import streamlit as st
-
     _ok, err = _probe_api_health(api_url, _hashable_headers(headers))
     if err:
         st.markdown(
@@ -926,14 +557,5 @@ def check_api_connection(api_url: str, headers: dict | None = None) -> bool:
 
 def empty_state(message: str, icon: str = "") -> None:
     """Render an empty state message."""
-    import streamlit as st
     icon_html = f'<div class="teleops-empty-icon">{icon}</div>' if icon else ""
-    st.markdown(
-        f"""
-        <div class="teleops-empty">
-            {icon_html}
-            <p>{message}</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(f'<div class="teleops-empty">{icon_html}<p>{message}</p></div>', unsafe_allow_html=True)
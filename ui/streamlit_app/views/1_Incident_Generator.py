@@ -0,0 +1,647 @@
+"""TeleOps Network Incident Command - Main Dashboard.
+
+A professional NOC-style interface for incident correlation, RCA generation,
+and baseline vs LLM comparison.
+"""
+
+from __future__ import annotations
+
+import html
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import streamlit as st
+from theme import (
+    DIVIDER_HTML,
+    badge,
+    check_api_connection,
+    conditional_get_json,
+    confidence_gauges,
+    divider,
+    empty_state,
+    hero,
+    inject_theme,
+    metric_grid,
+    nav_links,
+    pretty_json,
+    run_llm_rca_stream,
+    safe_api_call,
+    safe_json,
+    section_header,
+    severity_badge,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+API_URL = os.getenv("TELEOPS_API_URL") or os.getenv("API_BASE_URL", "http://localhost:8000")
+API_TOKEN = os.getenv("TELEOPS_API_TOKEN", "")
+TENANT_ID = os.getenv("TELEOPS_TENANT_ID", "")
+REQUEST_HEADERS = {}
+if API_TOKEN:
+    REQUEST_HEADERS["X-API-Key"] = API_TOKEN
+if TENANT_ID:
+    REQUEST_HEADERS["X-Tenant-Id"] = TENANT_ID
+HEADERS_KEY = tuple(sorted(REQUEST_HEADERS.items()))
+
+# Rows and columns shown in the Incident Context alert sample
+ALERT_SAMPLE_SIZE = 12
+ALERT_SAMPLE_COLUMNS = ("timestamp", "host", "service", "severity", "type", "message")
+# Fields read from the /alerts payload, in display order ("alert_type" shows as "type")
+_ALERT_SOURCE_FIELDS = ("timestamp", "host", "service", "severity", "alert_type", "message")
+ALERT_MESSAGE_WIDTH = 60
+
+SCENARIOS = {
+    "network_degradation": ("Network Degradation", "Packet loss and latency issues"),
+    "dns_outage": ("DNS Outage", "DNS resolution failures"),
+    "bgp_flap": ("BGP Flap", "Route instability and withdrawals"),
+    "fiber_cut": ("Fiber Cut", "Physical transport failure"),
+    "router_freeze": ("Router Freeze", "Control plane lockup"),
+    "isp_peering_congestion": ("ISP Peering Congestion", "Inter-carrier bottleneck"),
+    "ddos_edge": ("DDoS Attack", "Volumetric attack on edge"),
+    "mpls_vpn_leak": ("MPLS/VPN Leak", "Label stack misconfiguration"),
+    "cdn_cache_stampede": ("CDN Stampede", "Cache invalidation cascade"),
+    "firewall_rule_misconfig": ("Firewall Misconfig", "Blocked ports/ACL error"),
+    "database_latency_spike": ("Database Latency", "MSP app backend slowdown"),
+}
+SCENARIO_KEYS = tuple(SCENARIOS)
+SCENARIO_LABELS = {key: label for key, (label, _) in SCENARIOS.items()}
+SCENARIO_SUBTITLES = {key: subtitle for key, (_, subtitle) in SCENARIOS.items()}
+
+# Hypothesis text comes from the LLM, so it is escaped before filling the row.
+_HYPOTHESIS_ROW = (
+    "<div style='display: flex; gap: 12px; margin-bottom: 8px;'>"
+    "<span style='color: var(--accent); font-weight: 600; font-family: JetBrains Mono;'>{idx}.</span>"
+    "<span style='color: var(--ink);'>{text}</span></div>"
+)
+
+# render_rca_panel templates, filled with str.format
+_RCA_HEADER = "<h4 style='margin: 0 0 12px 0; font-size: 16px; font-weight: 600; color: var(--ink-strong);'>{title}</h4>"
+_RCA_HEADER_LLM = (
+    '<div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 12px;">'
+    '<h4 style="margin: 0; font-size: 16px; font-weight: 600; color: var(--ink-strong);">{title}</h4>'
+    '<span style="background: linear-gradient(135deg, #6C5CE7, #A29BFE); color: white; font-size: 10px; '
+    'font-weight: 600; padding: 4px 10px; border-radius: 4px; letter-spacing: 0.05em;">AI-POWERED</span>'
+    "</div>"
+)
+_RCA_PANEL_HEAD = (
+    "{header}\n\n"
+    "{model} &nbsp; {generated_at}\n\n"
+    "**Incident Summary**\n\n"
+    "<p style='color: var(--ink-muted); font-size: 14px;'>{summary}</p>"
+)
+
+_SIDEBAR_HEADER = (
+    '<div style="margin-bottom: 24px;">'
+    '<h2 style="font-size: 18px; font-weight: 600; color: var(--ink-strong); margin: 0;">Scenario Builder</h2>'
+    '<p style="font-size: 13px; color: var(--ink-dim); margin: 4px 0 0 0;">Generate synthetic incidents for testing</p>'
+    "</div>"
+)
+
+# One label/value cell of the Incident Context row; values are escaped by the caller
+_CONTEXT_CELL = (
+    "<div><p style='font-weight: 600; margin: 0 0 4px;'>{label}</p>"
+    "<span style='{style}'>{value}</span></div>"
+)
+_CONTEXT_COUNT_STYLE = "color: var(--accent); font-family: JetBrains Mono; font-weight: 600;"
+
+# Hypotheses shown inline; any beyond this go into a collapsed expander
+MAX_HYPOTHESES = 10
+
+
+def _hypothesis_rows(hypotheses: list, start: int = 1) -> str:
+    """Return the numbered hypothesis rows as one HTML string."""
+    return "".join(
+        _HYPOTHESIS_ROW.format(idx=idx, text=html.escape(str(item)))
+        for idx, item in enumerate(hypotheses, start=start)
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_incidents(api_url: str, headers_key: tuple) -> tuple[list, str | None]:
+    """GET /incidents. Cached briefly so filter/selectbox reruns reuse the queue; revalidated by ETag after that."""
+    return conditional_get_json(f"{api_url}/incidents", [], headers=dict(headers_key), timeout=30)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_alerts(api_url: str, incident_id: str, headers_key: tuple) -> tuple[pa.Table | None, str | None]:
+    """GET the alert sample for an incident as a display-ready Arrow table.
+
+    Alerts only change on generate/reset, so the fetch and the column
+    transforms below run once per incident rather than on every rerun.
+    pyarrow is imported here rather than at the top of the page because it
+    takes longer to import than the rest of the page, and it is only needed
+    once an incident with alerts is selected.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    resp, err = safe_api_call(
+        "GET",
+        f"{api_url}/incidents/{incident_id}/alerts",
+        params={"limit": ALERT_SAMPLE_SIZE},
+        headers=dict(headers_key),
+        timeout=30,
+    )
+    if err:
+        return None, err
+    alerts = safe_json(resp, [])[:ALERT_SAMPLE_SIZE]
+    table = pa.Table.from_pylist(alerts, schema=pa.schema([(name, pa.string()) for name in _ALERT_SOURCE_FIELDS]))
+    columns = [pc.fill_null(column, "") for column in table.columns]
+    columns[0] = pc.utf8_slice_codeunits(columns[0], 0, 19)
+    message = columns[-1]
+    columns[-1] = pc.if_else(
+        pc.greater(pc.utf8_length(message), ALERT_MESSAGE_WIDTH),
+        pc.binary_join_element_wise(pc.utf8_slice_codeunits(message, 0, ALERT_MESSAGE_WIDTH), "...", ""),
+        message,
+    )
+    return pa.Table.from_arrays(columns, names=list(ALERT_SAMPLE_COLUMNS)), None
+
+
+def _timed(func, *args, **kwargs):
+    """Call func and return (elapsed_seconds, result), for timing worker-thread calls."""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def _invalidate_incident_cache() -> None:
+    """Drop cached queue/alert data after a write to the incident store."""
+    _fetch_incidents.clear()
+    _fetch_alerts.clear()
+
+
+def render_rca_panel(title: str, payload: dict, is_llm: bool = False) -> None:
+    """Render an RCA result panel with hypotheses, confidence, and evidence."""
+    summary = payload.get("incident_summary", "N/A")
+    model = payload.get("model", "unknown")
+    generated_at = payload.get("generated_at", "")
+    hypotheses = payload.get("hypotheses", [])
+    confidence = payload.get("confidence_scores", {})
+    evidence = payload.get("evidence", {})
+
+    if hypotheses:
+        hypotheses_html = _hypothesis_rows(hypotheses[:MAX_HYPOTHESES])
+    else:
+        hypotheses_html = "<p style='color: var(--ink-dim);'>No hypotheses returned.</p>"
+    if confidence:
+        confidence_html = confidence_gauges(confidence)
+    else:
+        confidence_html = "<p style='color: var(--ink-dim);'>No confidence data.</p>"
+    evidence_html = "" if evidence else "<p style='color: var(--ink-dim);'>No evidence recorded.</p>"
+
+    # The panel goes out as one markdown element unless the overflow expander
+    # has to sit between the hypotheses and the gauges. Model, timestamp and
+    # summary come from the API/LLM, so they are escaped.
+    head = _RCA_PANEL_HEAD.format(
+        header=(_RCA_HEADER_LLM if is_llm else _RCA_HEADER).format(title=title),
+        model=badge(html.escape(str(model)), "accent"),
+        generated_at=badge(html.escape(str(generated_at)[:19]) if generated_at else "N/A", "muted"),
+        summary=html.escape(str(summary)),
+    )
+    tail = f"{DIVIDER_HTML}\n\n**Confidence Scores**\n\n{confidence_html}\n\n{DIVIDER_HTML}\n\n**Evidence**\n\n{evidence_html}"
+
+    overflow = hypotheses[MAX_HYPOTHESES:]
+    body = f"{head}\n\n{DIVIDER_HTML}\n\n**Hypotheses**\n\n{hypotheses_html}"
+    if overflow:
+        st.markdown(body, unsafe_allow_html=True)
+        with st.expander(f"Show {len(overflow)} more hypotheses"):
+            st.markdown(_hypothesis_rows(overflow, start=MAX_HYPOTHESES + 1), unsafe_allow_html=True)
+        st.markdown(tail, unsafe_allow_html=True)
+    else:
+        st.markdown(f"{body}\n\n{tail}", unsafe_allow_html=True)
+
+    if evidence:
+        with st.expander("View evidence details", expanded=False):
+            # A single pre-rendered block instead of st.json's interactive tree
+            st.code(pretty_json(evidence), language="json")
+
+
+def _summarize_incidents(rows: tuple) -> tuple:
+    """Return (critical, high, open, severities, statuses) for (id, severity, status) rows."""
+    severity_counts, status_counts = Counter(), Counter()
+    for _, severity, status in rows:
+        severity_counts[severity] += 1
+        status_counts[status] += 1
+    return (
+        severity_counts["critical"],
+        severity_counts["high"],
+        len(rows) - status_counts["resolved"],
+        sorted(severity_counts),
+        sorted(status_counts),
+    )
+
+
+def _filter_incidents(rows: tuple, severity_allowed: frozenset | None, status_allowed: frozenset | None) -> list[int]:
+    """Return the positions of rows matching the filters (None means no filtering)."""
+    return [
+        idx for idx, (_, severity, status) in enumerate(rows)
+        if (severity_allowed is None or severity in severity_allowed)
+        and (status_allowed is None or status in status_allowed)
+    ]
+
+
+@st.fragment
+def incident_queue(incidents: list) -> None:
+    """Stats bar, filters and incident selector.
+
+    Runs as a fragment so filter tweaks only rerun this block. The sections
+    below depend on the selection, so a full rerun is requested only when
+    the selected incident changes or RCA is requested.
+    """
+    full_run = st.session_state.pop("_queue_full_run", False)
+
+    rows = tuple(
+        (item["id"], (item.get("severity") or "unknown").lower(), (item.get("status") or "unknown").lower())
+        for item in incidents
+    )
+    critical_count, high_count, open_count, severities, statuses = _summarize_incidents(rows)
+
+    # Stats bar
+
+    st.markdown(
+        f"""
+        <div class="teleops-stats-bar">
+            <div class="teleops-stat">
+                <span class="teleops-stat-value" style="color: var(--critical);">{critical_count}</span>
+                <span class="teleops-stat-label">Critical</span>
+            </div>
+            <div class="teleops-stat">
+                <span class="teleops-stat-value" style="color: var(--accent-2);">{high_count}</span>
+                <span class="teleops-stat-label">High</span>
+            </div>
+            <div class="teleops-stat">
+                <span class="teleops-stat-value">{open_count}</span>
+                <span class="teleops-stat-label">Open</span>
+            </div>
+            <div class="teleops-stat">
+                <span class="teleops-stat-value" style="color: var(--accent);">{len(incidents)}</span>
+                <span class="teleops-stat-label">Total</span>
+            </div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Filters
+    filter_cols = st.columns([1, 1, 2, 1, 1])
+    with filter_cols[0]:
+        severity_filter = st.multiselect("Severity", options=severities, default=severities)
+    with filter_cols[1]:
+        status_filter = st.multiselect("Status", options=statuses, default=statuses)
+    with filter_cols[2]:
+        st.markdown("<div style='height: 28px;'></div>", unsafe_allow_html=True)
+        st.checkbox(
+            "Force RCA refresh",
+            key="rca_force_refresh",
+            help="Re-run RCA even if results for this incident are already loaded",
+        )
+    with filter_cols[3]:
+        st.markdown("<div style='height: 28px;'></div>", unsafe_allow_html=True)
+        if st.button("Refresh", help="Reload the incident queue from the API"):
+            _fetch_incidents.clear()
+            st.rerun()
+    with filter_cols[4]:
+        st.markdown("<div style='height: 28px;'></div>", unsafe_allow_html=True)
+        if st.button("Clear All", help="Remove all incidents from the queue"):
+            resp, err = safe_api_call("POST", f"{API_URL}/reset", headers=REQUEST_HEADERS, timeout=30)
+            if err:
+                st.error(err)
+            else:
+                _invalidate_incident_cache()
+                st.rerun()
+
+    # None means "no filtering": nothing selected, or every option selected (the default)
+    severity_allowed = frozenset(severity_filter) if 0 < len(severity_filter) < len(severities) else None
+    status_allowed = frozenset(status_filter) if 0 < len(status_filter) < len(statuses) else None
+    if severity_allowed is None and status_allowed is None:
+        filtered_incidents = incidents
+    else:
+        filtered_incidents = [incidents[idx] for idx in _filter_incidents(rows, severity_allowed, status_allowed)]
+
+    selected_id = None
+    run_rca = False
+    if filtered_incidents:
+        divider()
+
+        # Options are ids; the selectbox then only tracks short strings, and
+        # its labels are formatted once here rather than in a per-option lambda
+        by_id = {item["id"]: item for item in filtered_incidents}
+        labels = {
+            incident_id: f"{incident_id.rsplit('_', 2)[0]} - {(item.get('summary') or 'No summary')[:50]}"
+            for incident_id, item in by_id.items()
+        }
+
+        # Incident selector row
+        row = st.columns([3, 2, 0.8, 1.2])
+        with row[0]:
+            selected_id = st.selectbox(
+                "Select Incident",
+                options=list(by_id),
+                format_func=labels.__getitem__,
+                label_visibility="collapsed",
+            )
+            selected = by_id[selected_id]
+        with row[1]:
+            st.markdown(f"<p style='margin: 8px 0; color: var(--ink-muted); font-size: 13px;'>{selected.get('summary', '')[:50]}</p>", unsafe_allow_html=True)
+        with row[2]:
+            st.markdown(severity_badge(selected.get("severity")), unsafe_allow_html=True)
+        with row[3]:
+            run_rca = st.button("Run RCA", type="primary", use_container_width=True)
+    else:
+        empty_state("No incidents match filters", "")
+
+    changed = selected_id != st.session_state.get("selected_incident_id")
+    st.session_state["selected_incident_id"] = selected_id
+    if run_rca:
+        st.session_state["rca_requested"] = True
+    if (changed or run_rca) and not full_run:
+        st.rerun()
+
+
+@st.fragment
+def review_panel(reviewable: list) -> None:
+    """Reviewer inputs and accept/reject buttons for the loaded RCA artifacts.
+
+    Runs as a fragment, so typing a name or notes reruns only this block
+    instead of refetching the queue and re-rendering both RCA panels.
+    """
+    reviewer_name = st.text_input("Reviewer Name", value="", placeholder="Enter your name or operator ID").strip()
+    review_notes = st.text_area("Notes (optional)", value="", placeholder="Observations, corrections, or context", height=80)
+    review_base = {"reviewed_by": reviewer_name, "notes": review_notes or None}
+
+    review_cols = st.columns(len(reviewable))
+    for idx, (label, rca_payload) in enumerate(reviewable):
+        with review_cols[idx]:
+            review_url = f"{API_URL}/rca/{rca_payload['artifact_id']}/review"
+            hypothesis = rca_payload.get("hypotheses", ["N/A"])[0][:60]
+            st.markdown(f"**{label}:** {hypothesis}...")
+
+            btn_col1, btn_col2 = st.columns(2)
+            with btn_col1:
+                accept = st.button("Accept", key=f"accept_{label}", use_container_width=True)
+            with btn_col2:
+                reject = st.button("Reject", key=f"reject_{label}", use_container_width=True)
+            if not (accept or reject):
+                continue
+            if not reviewer_name:
+                st.error("Reviewer name required")
+                continue
+            decision = "accepted" if accept else "rejected"
+            resp, err = safe_api_call(
+                "POST",
+                review_url,
+                json={"decision": decision, **review_base},
+                headers=REQUEST_HEADERS,
+                timeout=10,
+            )
+            if err:
+                st.error(f"Review failed: {err}")
+            elif accept:
+                st.success(f"{label} hypothesis accepted")
+            else:
+                st.warning(f"{label} hypothesis rejected")
+
+
+# Page configuration
+st.set_page_config(
+    page_title="TeleOps Incident Generator",
+    page_icon="",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+# Inject theme
+inject_theme()
+
+# Check API connectivity before rendering the page
+check_api_connection(API_URL, REQUEST_HEADERS)
+
+# Navigation
+nav_links([
+    ("Incident Generator", "views/1_Incident_Generator.py", True),
+    ("LLM Trace", "views/3_LLM_Trace.py", False),
+    ("Observability", "views/2_Observability.py", False),
+], position="end")
+
+# Hero section
+hero(
+    title="Network Incident Command",
+    subtitle="Correlate NOC alerts into incidents, validate hypotheses, and compare baseline vs LLM-driven RCA with evidence.",
+    chip_text="TELEOPS LIVE",
+)
+
+# Sidebar - Scenario Builder
+with st.sidebar:
+    st.markdown(_SIDEBAR_HEADER, unsafe_allow_html=True)
+
+    scenario = st.selectbox(
+        "Incident Type",
+        options=SCENARIO_KEYS,
+        format_func=SCENARIO_LABELS.__getitem__,
+    )
+
+    st.caption(SCENARIO_SUBTITLES[scenario])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        alert_rate = st.number_input(
+            "Alert/min",
+            min_value=1,
+            max_value=100,
+            value=20,
+            help="Alerts generated per minute",
+        )
+    with col2:
+        duration = st.number_input(
+            "Duration",
+            min_value=1,
+            max_value=60,
+            value=10,
+            help="Incident duration in minutes",
+        )
+
+    col3, col4 = st.columns(2)
+    with col3:
+        noise_rate = st.number_input(
+            "Noise/min",
+            min_value=0,
+            max_value=50,
+            value=5,
+            help="Background noise alerts",
+        )
+    with col4:
+        seed = st.number_input(
+            "Seed",
+            min_value=0,
+            max_value=9999,
+            value=42,
+            help="Random seed for reproducibility",
+        )
+
+    if st.button("Generate Scenario", use_container_width=True):
+        payload = {
+            "incident_type": scenario,
+            "alert_rate_per_min": alert_rate,
+            "duration_min": duration,
+            "noise_rate_per_min": noise_rate,
+            "seed": seed,
+        }
+        with st.spinner("Generating..."):
+            resp, err = safe_api_call("POST", f"{API_URL}/generate", json=payload, headers=REQUEST_HEADERS, timeout=30)
+        if err:
+            st.error(err)
+        else:
+            _invalidate_incident_cache()
+            st.success("Scenario generated successfully")
+            data = safe_json(resp, {})
+            if data:
+                with st.expander("Generation details"):
+                    st.json(data)
+
+# Main content - Incident Queue
+section_header("Incident Queue", "Active incidents from synthetic runs")
+
+# Fetch incidents
+incidents, incidents_err = _fetch_incidents(API_URL, HEADERS_KEY)
+if incidents_err:
+    st.error(incidents_err)
+
+if incidents:
+    st.session_state["_queue_full_run"] = True
+    incident_queue(incidents)
+else:
+    st.session_state["selected_incident_id"] = None
+    empty_state("No incidents yet. Generate a scenario to begin.", "")
+
+selected = {item["id"]: item for item in incidents}.get(st.session_state.get("selected_incident_id"))
+
+# RCA results per incident id: {"baseline": payload, "llm": payload}
+rca_cache = st.session_state.setdefault("rca_cache", {})
+rca_entry = rca_cache.get(selected["id"], {}) if selected else {}
+
+# Results are kept per incident and mode, so a repeat request only re-runs
+# the modes that are missing (e.g. an LLM call that failed) unless forced.
+rca_force = st.session_state.get("rca_force_refresh", False)
+need_baseline = rca_force or "baseline" not in rca_entry
+need_llm = rca_force or "llm" not in rca_entry
+
+if selected and st.session_state.pop("rca_requested", False) and (need_baseline or need_llm):
+    # Baseline and LLM RCA are independent: baseline runs on a worker thread
+    # while the LLM stream is read here. One st.status box shows each LLM
+    # stage as it starts, then lists the finished modes with their timings.
+    llm_payload, llm_err = None, None
+    baseline_resp, baseline_err = None, None
+    finished = []
+    with st.status(
+        "Running baseline and LLM RCA..." if need_baseline and need_llm else "Running RCA...", expanded=True
+    ) as rca_status, ThreadPoolExecutor(max_workers=1) as pool:
+        started = time.perf_counter()
+        baseline_future = pool.submit(
+            _timed,
+            safe_api_call,
+            "POST",
+            f"{API_URL}/rca/{selected['id']}/baseline",
+            headers=REQUEST_HEADERS,
+            timeout=60,
+        ) if need_baseline else None
+        if need_llm:
+            llm_payload, llm_err = run_llm_rca_stream(
+                f"{API_URL}/rca/{selected['id']}/llm/stream",
+                lambda label: rca_status.update(label=label),
+                headers=REQUEST_HEADERS,
+            )
+            finished.append((time.perf_counter() - started, "LLM RCA", llm_err))
+        if baseline_future is not None:
+            baseline_elapsed, (baseline_resp, baseline_err) = baseline_future.result()
+            finished.append((baseline_elapsed, "Baseline RCA", baseline_err))
+        for elapsed, label, err in sorted(finished):
+            rca_status.write(f"{label} {'failed' if err else 'complete'} ({elapsed:.1f}s)")
+        failed = any(err for _, _, err in finished)
+        rca_status.update(
+            label="RCA finished with errors" if failed else "RCA complete",
+            state="error" if failed else "complete",
+            expanded=False,
+        )
+
+    rca_entry = rca_cache.setdefault(selected["id"], {})
+    if need_baseline:
+        if baseline_err:
+            st.error(f"Baseline RCA failed: {baseline_err}")
+        else:
+            rca_entry["baseline"] = safe_json(baseline_resp, {})
+    if need_llm:
+        if llm_err:
+            st.error(f"LLM RCA failed: {llm_err}")
+        else:
+            rca_entry["llm"] = llm_payload
+
+# Incident Context
+if selected:
+    section_header("Incident Context", "Metadata and alert sample")
+
+    # The four label/value cells go out as one grid row: bold label, value below
+    status = selected.get("status", "unknown")
+    status_style = f"color: {'var(--success)' if status.lower() == 'resolved' else 'var(--info)'}; font-weight: 500;"
+    alert_count = len(selected.get("related_alert_ids", []))
+    impact = html.escape(str(selected.get("impact_scope", "unknown")))
+    owner = html.escape(selected.get("owner") or "Unassigned")
+    st.markdown(
+        metric_grid([
+            _CONTEXT_CELL.format(label="Status", style=status_style, value=html.escape(status)),
+            _CONTEXT_CELL.format(label="Impact", style="color: var(--ink-muted);", value=impact),
+            _CONTEXT_CELL.format(label="Owner", style="color: var(--ink-muted);", value=owner),
+            _CONTEXT_CELL.format(label="Alerts", style=_CONTEXT_COUNT_STYLE, value=alert_count),
+        ]),
+        unsafe_allow_html=True,
+    )
+
+    # Fetch and display alerts; incidents without related alerts skip the request
+    if alert_count == 0:
+        st.caption("No related alerts")
+    else:
+        alert_table, alert_err = _fetch_alerts(API_URL, selected["id"], HEADERS_KEY)
+        if alert_err:
+            st.error(alert_err)
+        else:
+            with st.expander(f"Alert sample (showing {alert_table.num_rows} of {alert_count})"):
+                # An Arrow table goes to the frontend as-is, with no pandas round trip
+                st.dataframe(alert_table, use_container_width=True, hide_index=True)
+
+
+# RCA Output Section
+baseline_payload = rca_entry.get("baseline")
+llm_payload = rca_entry.get("llm")
+
+if baseline_payload or llm_payload:
+    section_header("RCA Comparison", "Baseline (rule-based) vs LLM (AI-powered)")
+    left, right = st.columns(2, gap="large")
+    with left:
+        if baseline_payload:
+            render_rca_panel("Baseline RCA", baseline_payload, is_llm=False)
+        else:
+            st.markdown("<p style='color: var(--ink-dim); padding: 20px; text-align: center;'>Baseline RCA not available</p>", unsafe_allow_html=True)
+    with right:
+        if llm_payload:
+            render_rca_panel("LLM RCA", llm_payload, is_llm=True)
+        else:
+            st.markdown("<p style='color: var(--ink-dim); padding: 20px; text-align: center;'>LLM RCA not available</p>", unsafe_allow_html=True)
+
+    # --- Human Review Section ---
+    divider()
+    section_header("Hypothesis Review", "Accept or reject RCA hypotheses (human-in-the-loop gate)")
+
+    # Determine which artifacts to review
+    reviewable = []
+    if baseline_payload and baseline_payload.get("artifact_id"):
+        reviewable.append(("Baseline", baseline_payload))
+    if llm_payload and llm_payload.get("artifact_id"):
+        reviewable.append(("LLM", llm_payload))
+
+    if reviewable:
+        review_panel(reviewable)
+    else:
+        st.caption("Run RCA above to generate hypotheses for review.")
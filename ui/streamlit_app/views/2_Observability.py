@@ -0,0 +1,274 @@
+"""TeleOps Observability Dashboard."""
+
+import html
+import os
+
+import streamlit as st
+from theme import (
+    badge,
+    check_api_connection,
+    conditional_get_json,
+    empty_state,
+    hero,
+    inject_theme,
+    metric_card,
+    metric_grid,
+    nav_links,
+    pretty_json,
+    progress_bar,
+    section_header,
+)
+
+API_URL = os.getenv("TELEOPS_API_URL") or os.getenv("API_BASE_URL", "http://localhost:8000")
+API_TOKEN = os.getenv("TELEOPS_API_TOKEN", "")
+TENANT_ID = os.getenv("TELEOPS_TENANT_ID", "")
+METRICS_TOKEN = os.getenv("TELEOPS_METRICS_TOKEN", API_TOKEN)
+REQUEST_HEADERS = {}
+if METRICS_TOKEN:
+    REQUEST_HEADERS["X-API-Key"] = METRICS_TOKEN
+if TENANT_ID:
+    REQUEST_HEADERS["X-Tenant-Id"] = TENANT_ID
+HEADERS_KEY = tuple(sorted(REQUEST_HEADERS.items()))
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_overview(api_url: str, headers_key: tuple) -> tuple[dict, str | None]:
+    """GET /metrics/overview. Cached briefly so widget reruns reuse the last payload.
+
+    Once the cache expires the request is revalidated by ETag, so unchanged
+    metrics come back as an empty 304. The per-scenario breakdown is left
+    out; it is fetched on demand by _fetch_per_scenario.
+    """
+    return conditional_get_json(
+        f"{api_url}/metrics/overview",
+        {},
+        params={"include_per_scenario": "false"},
+        headers=dict(headers_key),
+        timeout=30,
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_per_scenario(api_url: str, headers_key: tuple) -> tuple[list, str | None]:
+    """GET /metrics/evaluation/per-scenario, only once the user asks for the breakdown."""
+    data, err = conditional_get_json(
+        f"{api_url}/metrics/evaluation/per-scenario", {}, headers=dict(headers_key), timeout=30
+    )
+    return data.get("per_scenario", []), err
+
+
+st.set_page_config(page_title="TeleOps Observability", layout="wide")
+inject_theme()
+check_api_connection(API_URL, REQUEST_HEADERS)
+
+nav_links([
+    ("Incident Generator", "views/1_Incident_Generator.py", False),
+    ("LLM Trace", "views/3_LLM_Trace.py", False),
+    ("Observability", "views/2_Observability.py", True),
+], position="end")
+
+hero(
+    title="Observability Dashboard",
+    subtitle="Operational metrics, decision quality, and time-to-context analysis.",
+    chip_text="METRICS",
+)
+
+if st.button("Refresh metrics", help="Reload the overview from the API instead of the cached copy"):
+    _fetch_overview.clear()
+    _fetch_per_scenario.clear()
+payload, err = _fetch_overview(API_URL, HEADERS_KEY)
+if err:
+    st.error(err)
+    st.stop()
+
+counts = payload.get("counts", {})
+kpis = payload.get("kpis", {})
+
+# Metric cards
+avg = kpis.get("avg_alerts_per_incident", 0.0)
+st.markdown(
+    metric_grid([
+        metric_card(counts.get("alerts", 0), "Total Alerts", "accent"),
+        metric_card(counts.get("incidents", 0), "Incidents", "accent-2"),
+        metric_card(counts.get("rca_artifacts", 0), "RCA Artifacts", "accent-3"),
+        metric_card(f"{avg:.1f}", "Avg Alerts/Incident", "ink"),
+    ]),
+    unsafe_allow_html=True,
+)
+
+# Test Results
+section_header("Test Results", "pytest coverage and pass rate")
+
+test_results = payload.get("test_results")
+if test_results:
+    tests = test_results.get("tests", {})
+    coverage = test_results.get("coverage", {})
+    pass_rate = tests.get("pass_rate", 0.0) * 100
+    coverage_pct = coverage.get("percent_covered", 0.0)
+
+    # Both bars go out as one grid row in a single st.markdown call
+    st.markdown(
+        metric_grid([
+            f"<div><b>Pass Rate:</b> {pass_rate:.1f}%"
+            f"{progress_bar(pass_rate, 'success' if pass_rate >= 90 else 'warning')}</div>",
+            f"<div><b>Coverage:</b> {coverage_pct:.1f}%"
+            f"{progress_bar(coverage_pct, 'success' if coverage_pct >= 80 else 'warning')}</div>",
+        ]),
+        unsafe_allow_html=True,
+    )
+
+    with st.expander("Raw test data"):
+        st.code(pretty_json(test_results), language="json")
+else:
+    empty_state("No test results. Run: python scripts/run_tests.py", "")
+
+# --- RCA Quality Metrics ---
+section_header("RCA Decision Quality", "Precision, recall, and confidence calibration")
+
+evaluation_results = payload.get("evaluation_results")
+if evaluation_results and evaluation_results.get("quality_metrics"):
+    qm = evaluation_results["quality_metrics"]
+
+    # Scoring method badge
+    scoring = evaluation_results.get("scoring_method", "unknown")
+    runs_count = evaluation_results.get("runs", 0)
+    st.markdown(
+        f'<div class="teleops-badge-row">{badge(html.escape(str(scoring)), "accent")} &nbsp; '
+        f'{badge(f"{runs_count} scenarios", "accent-2")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    # Baseline vs LLM comparison
+    col_b, col_l = st.columns(2)
+
+    for col, source, label in [(col_b, "baseline", "Baseline (Rules)"), (col_l, "llm", "LLM + RAG")]:
+        with col:
+            st.markdown(f"**{label}**")
+            metrics = qm.get(source)
+            if metrics is None:
+                st.caption("Not evaluated (LLM not configured)")
+                continue
+
+            # Precision, recall and wrong-but-confident rate, sent as one block
+            precision_pct = metrics["precision"] * 100
+            recall_pct = metrics["recall"] * 100
+            wbc = metrics["wrong_but_confident_rate"] * 100
+            wbc_color = "success" if wbc < 5 else ("warning" if wbc < 15 else "critical")
+            st.markdown(
+                "\n\n".join([
+                    f"Precision: **{precision_pct:.1f}%** ({metrics['total_correct']}/{metrics['total_attempted']})",
+                    progress_bar(precision_pct, "success" if precision_pct >= 80 else "warning"),
+                    f"Recall: **{recall_pct:.1f}%**",
+                    progress_bar(recall_pct, "success" if recall_pct >= 80 else "warning"),
+                    f"Wrong-but-Confident: **{wbc:.1f}%** ({metrics['wrong_but_confident_count']} cases)",
+                    f'<div style="color: var(--{wbc_color}); font-size: 12px;">'
+                    f'{"Low risk" if wbc < 5 else "Monitor" if wbc < 15 else "High risk - review needed"}'
+                    f'</div>',
+                ]),
+                unsafe_allow_html=True,
+            )
+
+            # Confidence calibration
+            st.caption("Confidence Calibration")
+            conf_correct = metrics.get("avg_confidence_correct")
+            conf_incorrect = metrics.get("avg_confidence_incorrect")
+            calibration_lines = []
+            if conf_correct is not None:
+                calibration_lines.append(f"Avg confidence (correct): **{conf_correct:.3f}**")
+            if conf_incorrect is not None:
+                calibration_lines.append(f"Avg confidence (incorrect): **{conf_incorrect:.3f}**")
+            if conf_correct and conf_incorrect:
+                gap = conf_correct - conf_incorrect
+                calibration = "Well-calibrated" if gap > 0.1 else "Poorly calibrated"
+                calibration_lines.append(f"Gap: **{gap:+.3f}** ({calibration})")
+            if calibration_lines:
+                st.markdown("\n\n".join(calibration_lines))
+
+    # Overall similarity scores
+    st.markdown('<p class="teleops-section"><strong>Similarity Scores (Semantic)</strong></p>', unsafe_allow_html=True)
+    llm_avg = evaluation_results.get("llm_avg")
+    llm_med = evaluation_results.get("llm_median")
+    st.markdown(
+        metric_grid([
+            metric_card(f"{evaluation_results.get('baseline_avg', 0):.3f}", "Baseline Avg", "accent"),
+            metric_card(f"{evaluation_results.get('baseline_median', 0):.3f}", "Baseline Median", "accent"),
+            metric_card(f"{llm_avg:.3f}" if llm_avg else "N/A", "LLM Avg", "accent-2"),
+            metric_card(f"{llm_med:.3f}" if llm_med else "N/A", "LLM Median", "accent-2"),
+        ]),
+        unsafe_allow_html=True,
+    )
+
+    with st.expander("Raw evaluation data"):
+        # One pre-rendered block instead of st.json's interactive tree
+        st.code(pretty_json(evaluation_results), language="json")
+
+    # An expander body runs even while collapsed, so a toggle gates the fetch instead
+    if st.toggle("Per-scenario breakdown"):
+        per_scenario, per_scenario_err = _fetch_per_scenario(API_URL, HEADERS_KEY)
+        if per_scenario_err:
+            st.error(per_scenario_err)
+        else:
+            st.code(pretty_json(per_scenario), language="json")
+
+elif evaluation_results:
+    # Legacy format without quality_metrics
+    with st.expander("View evaluation data", expanded=True):
+        st.code(pretty_json(evaluation_results), language="json")
+else:
+    empty_state("No evaluation results. Run: python scripts/evaluate.py --write-json storage/evaluation_results.json", "")
+
+# --- Time-to-Context ---
+section_header("Time to Actionable Context", "How fast operators get RCA hypotheses")
+
+ttc = payload.get("time_to_context")
+if ttc:
+    manual_min = ttc.get("manual_estimate_min", 25)
+    baseline_ms = ttc.get("baseline_median_ms")
+    llm_ms = ttc.get("llm_median_ms")
+    improvement = ttc.get("improvement_factor")
+
+    st.markdown(
+        metric_grid([
+            metric_card(f"{manual_min} min", "Manual Triage (est.)", "critical"),
+            metric_card(f"{baseline_ms:.0f} ms", "Baseline RCA", "accent")
+            if baseline_ms is not None
+            else metric_card("N/A", "Baseline RCA", "ink"),
+            metric_card(f"{llm_ms:.0f} ms", "LLM RCA", "accent-2")
+            if llm_ms is not None
+            else metric_card("N/A", "LLM RCA", "ink"),
+        ]),
+        unsafe_allow_html=True,
+    )
+
+    if improvement:
+        st.markdown(
+            f'<div style="text-align: center; margin-top: 12px; padding: 12px; '
+            f'background: var(--accent-glow); border-radius: 8px; border: 1px solid var(--accent);">'
+            f'<span style="font-size: 24px; font-weight: 700; color: var(--accent);">'
+            f'{improvement:.0f}x faster</span>'
+            f'<span style="color: var(--ink-muted); margin-left: 8px;">than manual triage</span>'
+            f'</div>',
+            unsafe_allow_html=True,
+        )
+
+    st.caption("Manual estimate based on industry benchmarks for telecom NOC triage (15-30 min median).")
+else:
+    empty_state("No timing data. Generate incidents and run RCA to collect latency metrics.", "")
+
+# --- Human Review KPIs ---
+section_header("Human Review Status", "RCA hypothesis acceptance and review rates")
+
+review = payload.get("human_review")
+if review:
+    rate = review.get("acceptance_rate", 0)
+    st.markdown(
+        metric_grid([
+            metric_card(review.get("total_artifacts", 0), "Total RCAs", "ink"),
+            metric_card(review.get("pending_review", 0), "Pending Review", "accent-2"),
+            metric_card(review.get("accepted", 0), "Accepted", "accent"),
+            metric_card(f"{rate:.0%}" if isinstance(rate, float) else "N/A", "Acceptance Rate", "accent"),
+        ]),
+        unsafe_allow_html=True,
+    )
+else:
+    empty_state("No review data. Review RCA hypotheses from the Incident Generator page.", "")
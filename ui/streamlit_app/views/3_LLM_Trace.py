@@ -0,0 +1,244 @@
+"""TeleOps LLM Response Viewer."""
+
+import html
+import os
+
+import streamlit as st
+from theme import (
+    badge,
+    check_api_connection,
+    conditional_get_json,
+    divider,
+    empty_state,
+    hero,
+    inject_theme,
+    nav_links,
+    pretty_json,
+    run_llm_rca_stream,
+    safe_api_call,
+    safe_json,
+)
+
+API_URL = os.getenv("TELEOPS_API_URL") or os.getenv("API_BASE_URL", "http://localhost:8000")
+API_TOKEN = os.getenv("TELEOPS_API_TOKEN", "")
+TENANT_ID = os.getenv("TELEOPS_TENANT_ID", "")
+REQUEST_HEADERS = {}
+if API_TOKEN:
+    REQUEST_HEADERS["X-API-Key"] = API_TOKEN
+if TENANT_ID:
+    REQUEST_HEADERS["X-Tenant-Id"] = TENANT_ID
+HEADERS_KEY = tuple(sorted(REQUEST_HEADERS.items()))
+INCIDENT_KEY = "trace_incident"
+RAG_CHUNK_PREVIEW = 300
+_RAG_CHUNK = (
+    "<p style='font-weight: 600; margin: 0 0 4px;'>Chunk {idx}:</p>"
+    "<div style='background: var(--bg); padding: 12px; border-radius: 8px; font-size: 13px; "
+    "color: var(--ink-muted); margin-bottom: 8px;'>{text}</div>"
+)
+
+
+# Panel headings for the request/response columns, built once at import
+_PANEL_TITLE = (
+    '<div style="display: flex; align-items: center; gap: 12px;">'
+    '<h4 style="margin: 0; font-size: 16px; font-weight: 600; color: var(--ink-strong);">{title}</h4>'
+    '<span style="font-size: 12px; color: var(--ink-dim);">{subtitle}</span></div>'
+)
+_REQUEST_HEADER = (
+    '<div style="margin-bottom: 16px;">'
+    + _PANEL_TITLE.format(title="LLM Request", subtitle="Input sent to model")
+    + "</div>"
+)
+_RESPONSE_HEADER = (
+    '<div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 16px;">'
+    + _PANEL_TITLE.format(title="LLM Response", subtitle="Structured output")
+    + '<span style="background: linear-gradient(135deg, #6C5CE7, #A29BFE); color: white; font-size: 10px; '
+    'font-weight: 600; padding: 4px 10px; border-radius: 4px; letter-spacing: 0.05em;">AI-POWERED</span></div>'
+)
+
+
+def _rag_context_html(rag: list) -> str:
+    """Render every RAG chunk preview into one HTML string for a single st.markdown call."""
+    parts = []
+    for idx, chunk in enumerate(rag, 1):
+        chunk = chunk if isinstance(chunk, str) else str(chunk)
+        text = chunk[:RAG_CHUNK_PREVIEW] + ("..." if len(chunk) > RAG_CHUNK_PREVIEW else "")
+        # Newlines would end the HTML block in markdown, so fold them into spaces
+        parts.append(_RAG_CHUNK.format(idx=idx, text=html.escape(text).replace("\n", " ")))
+    return "".join(parts)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_incidents(api_url: str, headers_key: tuple) -> tuple[list, str | None]:
+    """GET /incidents. Cached briefly so reruns reuse the list; revalidated by ETag after that."""
+    return conditional_get_json(f"{api_url}/incidents", [], headers=dict(headers_key), timeout=30)
+
+
+class _ArtifactFetchError(Exception):
+    """Raised inside the cached fetch so st.cache_data never stores a failure."""
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_latest_llm_rca(api_url: str, incident_id: str, headers_key: tuple) -> dict:
+    """GET the newest LLM RCA artifact for an incident, raising on any error.
+
+    Cached per incident, so switching back to an incident already viewed
+    (or any other rerun) does not fetch the artifact again.
+    """
+    resp, err = safe_api_call(
+        "GET",
+        f"{api_url}/rca/{incident_id}/latest",
+        params={"source": "llm"},
+        headers=dict(headers_key),
+        timeout=30,
+    )
+    if err:
+        raise _ArtifactFetchError(err)
+    return safe_json(resp, {})
+
+
+def _fetch_latest_llm_rca(api_url: str, incident_id: str, headers_key: tuple) -> tuple[dict, str | None]:
+    """Return (artifact, error) for an incident's newest LLM RCA.
+
+    Only successful fetches are cached: a 404 for "no artifact yet" is asked
+    again on the next rerun, so an RCA run from either page shows up at once.
+    """
+    try:
+        return _cached_latest_llm_rca(api_url, incident_id, headers_key), None
+    except _ArtifactFetchError as exc:
+        return {}, str(exc)
+
+
+st.set_page_config(page_title="LLM Response Viewer", layout="wide")
+inject_theme()
+check_api_connection(API_URL, REQUEST_HEADERS)
+
+nav_links([
+    ("Incident Generator", "views/1_Incident_Generator.py", False),
+    ("LLM Trace", "views/3_LLM_Trace.py", True),
+    ("Observability", "views/2_Observability.py", False),
+], position="end")
+
+hero(
+    title="LLM Request / Response Viewer",
+    subtitle="Inspect prompt inputs, RAG context, and structured output for debugging.",
+    chip_text="LLM TRACE",
+)
+
+incidents, incidents_err = _fetch_incidents(API_URL, HEADERS_KEY)
+if incidents_err:
+    st.error(incidents_err)
+    st.stop()
+
+if not incidents:
+    empty_state("No incidents available. Generate a scenario first.", "")
+    st.stop()
+
+# Options are plain ids, so widget state never has to hash incident dicts
+labels = {i["id"]: f"{i['id'].rsplit('_', 2)[0]} - {(i.get('summary') or 'No summary')[:50]}" for i in incidents}
+selected_id = st.selectbox("Select Incident", options=list(labels), format_func=labels.__getitem__, key=INCIDENT_KEY)
+
+artifact, artifact_err = _fetch_latest_llm_rca(API_URL, selected_id, HEADERS_KEY)
+
+if artifact_err:
+    # Check if it was a 404 (no RCA yet) vs a real error
+    if artifact_err.startswith("[404]"):
+        st.warning("No LLM RCA found for this incident.")
+        if st.button("Run LLM RCA", type="primary"):
+            progress = st.empty()
+            progress.info("Running LLM RCA...")
+            _, run_err = run_llm_rca_stream(
+                f"{API_URL}/rca/{selected_id}/llm/stream", progress.info, headers=REQUEST_HEADERS
+            )
+            progress.empty()
+            if run_err:
+                st.error(run_err)
+            else:
+                _cached_latest_llm_rca.clear()
+                st.rerun()
+        st.stop()
+    else:
+        st.error(artifact_err)
+        st.stop()
+
+if not artifact:
+    st.error("Could not parse RCA artifact response.")
+    st.stop()
+evidence = artifact.get("evidence", {})
+
+# Support both new format (llm_request/llm_response) and legacy format (flat fields)
+llm_request = evidence.get("llm_request", {})
+llm_response = evidence.get("llm_response", {})
+rag_query = evidence.get("rag_query", "N/A")
+alerts_count = evidence.get("alerts_count", 0)
+rag_chunks_used = evidence.get("rag_chunks_used", 0)
+
+left, right = st.columns(2, gap="large")
+
+with left:
+    st.markdown(_REQUEST_HEADER, unsafe_allow_html=True)
+
+    # RAG query used for retrieval
+    st.markdown("**RAG Query**")
+    st.code(rag_query if isinstance(rag_query, str) else str(rag_query), language=None)
+
+    st.caption(f"Alerts analyzed: **{alerts_count}** | RAG chunks used: **{rag_chunks_used}**")
+
+    divider()
+
+    if llm_request:
+        # New format: full request payload available
+        st.markdown("**Incident Context**")
+        st.code(pretty_json(llm_request.get("incident", {})), language="json")
+
+        divider()
+
+        st.markdown("**Alerts Sample**")
+        alerts = llm_request.get("alerts_sample", [])
+        if alerts:
+            st.code(pretty_json(alerts[:5]), language="json")
+            if len(alerts) > 5:
+                st.caption(f"+ {len(alerts) - 5} more alerts")
+        else:
+            st.markdown("<p style='color: var(--ink-dim);'>No alerts recorded</p>", unsafe_allow_html=True)
+
+        divider()
+
+        st.markdown("**RAG Context**")
+        rag = llm_request.get("rag_context", [])
+        if rag:
+            st.markdown(_rag_context_html(rag if isinstance(rag, list) else [rag]), unsafe_allow_html=True)
+        else:
+            st.markdown("<p style='color: var(--ink-dim);'>No RAG context</p>", unsafe_allow_html=True)
+    else:
+        # Legacy format: only flat evidence fields available
+        st.info("Detailed request payload not captured for this artifact. Showing summary fields only.")
+        llm_evidence = evidence.get("llm_evidence", {})
+        if llm_evidence:
+            st.markdown("**LLM Evidence**")
+            st.code(pretty_json(llm_evidence), language="json")
+
+with right:
+    st.markdown(_RESPONSE_HEADER, unsafe_allow_html=True)
+
+    # Server-provided strings are escaped here, once, before reaching the HTML helpers
+    artifact_badges = (
+        f"<div class='teleops-badge-row'>{badge(html.escape(str(artifact.get('model', 'unknown'))), 'accent')} &nbsp; "
+        f"{badge(html.escape(str(artifact.get('generated_at') or '')[:19]), 'muted')}</div>"
+    )
+    if llm_response:
+        st.markdown(artifact_badges, unsafe_allow_html=True)
+        st.code(pretty_json(llm_response), language="json")
+    elif artifact.get("hypotheses"):
+        # Fallback: show hypotheses from the artifact directly
+        st.markdown(artifact_badges, unsafe_allow_html=True)
+        st.markdown("**Hypotheses**")
+        st.code(pretty_json(artifact["hypotheses"]), language="json")
+        if artifact.get("confidence_scores"):
+            st.markdown("**Confidence Scores**")
+            st.code(pretty_json(artifact["confidence_scores"]), language="json")
+    else:
+        st.markdown("<p style='color: var(--ink-dim); text-align: center; padding: 20px;'>No response recorded</p>", unsafe_allow_html=True)
+
+# Raw evidence expander for debugging
+with st.expander("Raw Evidence JSON"):
+    st.code(pretty_json(evidence), language="json")